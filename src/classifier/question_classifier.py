@@ -1,14 +1,45 @@
 """Question type classifier using LLM."""
 
+import re
+
 import structlog
-from openai import AsyncOpenAI
-from anthropic import AsyncAnthropic
 
-from src.config.settings import Settings
+from src.classifier.semantic_cache import SemanticClassifierCache
+from src.config.settings import RuntimeSettings
+from src.integrations.llm_clients import get_anthropic_client, get_openai_client
 from src.models.conversation import QuestionType
 
 logger = structlog.get_logger(__name__)
 
+_SEPARATOR_PATTERN = re.compile(r"[\s\-]+")
+_INVALID_CHAR_PATTERN = re.compile(r"[^a-z_]")
+
+# Normalized model output -> question type, including common model variants
+_TYPE_MAP: dict[str, QuestionType] = {
+    "bug": QuestionType.BUG,
+    "buggy": QuestionType.BUG,
+    "how_to": QuestionType.HOW_TO,
+    "howto": QuestionType.HOW_TO,
+    "feature_request": QuestionType.FEATURE_REQUEST,
+    "feature": QuestionType.FEATURE_REQUEST,
+    "ops_action": QuestionType.OPS_ACTION,
+    "ops": QuestionType.OPS_ACTION,
+    "other": QuestionType.OTHER,
+}
+
+
+def _normalize_classification(classification: str) -> str:
+    """Canonicalize raw model output to a _TYPE_MAP key.
+
+    Args:
+        classification: Raw model output
+
+    Returns:
+        Lowercase label with separators collapsed to underscores
+    """
+    label = _SEPARATOR_PATTERN.sub("_", classification.strip().lower())
+    return _INVALID_CHAR_PATTERN.sub("", label).strip("_")
+
 
 class QuestionClassifier:
     """Classifier for determining question types."""
@@ -26,26 +57,61 @@ Message: {message}
 Respond with ONLY the category name (bug, how_to, feature_request, ops_action, or other).
 """
 
-    def __init__(self, settings: Settings) -> None:
+    SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful classification assistant."}
+
+    def __init__(self, settings: RuntimeSettings) -> None:
         """Initialize the classifier.
 
         Args:
-            settings: Application settings
+            settings: Runtime settings snapshot
         """
         self.settings = settings
+        self._log = logger.bind(
+            component="classifier",
+            provider=settings.llm_provider,
+            model=settings.llm_model,
+        )
+        self._prompt_prefix, self._prompt_suffix = self.CLASSIFICATION_PROMPT.split("{message}")
+        self._openai_key = (
+            settings.openai_api_key.get_secret_value() if settings.openai_api_key else None
+        )
 
         if settings.llm_provider == "openai":
-            if not settings.openai_api_key:
+            if not self._openai_key:
                 raise ValueError("OpenAI API key is required")
-            self.client = AsyncOpenAI(
-                api_key=settings.openai_api_key.get_secret_value()
-            )
+            self.client = get_openai_client(self._openai_key)
+            self._call = self._call_openai
         else:
             if not settings.anthropic_api_key:
                 raise ValueError("Anthropic API key is required")
-            self.client = AsyncAnthropic(
-                api_key=settings.anthropic_api_key.get_secret_value()
-            )
+            self.client = get_anthropic_client(settings.anthropic_api_key.get_secret_value())
+            self._call = self._call_anthropic
+
+        self.cache = self._create_cache(settings)
+
+    def _create_cache(self, settings: RuntimeSettings) -> SemanticClassifierCache | None:
+        """Create the semantic cache if embeddings are available.
+
+        Args:
+            settings: Runtime settings snapshot
+
+        Returns:
+            Semantic cache or None if disabled
+        """
+        if not settings.classifier_cache_enabled:
+            return None
+
+        if settings.embeddings_provider != "openai" or not self._openai_key:
+            self._log.info("Classifier cache disabled, OpenAI embeddings not configured")
+            return None
+
+        return SemanticClassifierCache(
+            client=get_openai_client(self._openai_key),
+            model=settings.embeddings_model,
+            threshold=settings.classifier_cache_threshold,
+            max_entries=settings.classifier_cache_max_entries,
+            ttl_seconds=settings.classifier_cache_ttl_seconds,
+        )
 
     async def classify(self, message: str) -> QuestionType:
         """Classify a message into a question type.
@@ -56,45 +122,35 @@ Respond with ONLY the category name (bug, how_to, feature_request, ops_action, o
         Returns:
             Question type
         """
-        logger.info("Classifying message", message_length=len(message))
+        self._log.info("Classifying message", message_length=len(message))
+
+        embedding = None
+        if self.cache is not None:
+            try:
+                embedding = await self.cache.embed(message)
+                cached_type = self.cache.lookup(embedding)
+            except Exception as e:
+                self._log.warning("Classifier cache unavailable", error=str(e))
+                cached_type = None
+
+            if cached_type is not None:
+                self._log.info("Classification cache hit", question_type=cached_type.value)
+                return cached_type
 
         try:
-            prompt = self.CLASSIFICATION_PROMPT.format(message=message)
-
-            if self.settings.llm_provider == "openai":
-                response = await self.client.chat.completions.create(
-                    model=self.settings.llm_model,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful classification assistant."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.1,
-                    max_tokens=10,
-                )
-                classification = response.choices[0].message.content.strip().lower()
-            else:
-                response = await self.client.messages.create(
-                    model=self.settings.llm_model,
-                    max_tokens=10,
-                    temperature=0.1,
-                    messages=[
-                        {"role": "user", "content": prompt},
-                    ],
-                )
-                classification = response.content[0].text.strip().lower()
+            prompt = self._prompt_prefix + message + self._prompt_suffix
+
+            classification = (await self._call(prompt)).strip().lower()
 
             # Map to QuestionType enum
-            type_map = {
-                "bug": QuestionType.BUG,
-                "how_to": QuestionType.HOW_TO,
-                "feature_request": QuestionType.FEATURE_REQUEST,
-                "ops_action": QuestionType.OPS_ACTION,
-                "other": QuestionType.OTHER,
-            }
+            question_type = _TYPE_MAP.get(
+                _normalize_classification(classification), QuestionType.OTHER
+            )
 
-            question_type = type_map.get(classification, QuestionType.OTHER)
+            if embedding is not None:
+                self.cache.insert(embedding, question_type)
 
-            logger.info(
+            self._log.info(
                 "Message classified",
                 classification=classification,
                 question_type=question_type.value,
@@ -103,5 +159,44 @@ Respond with ONLY the category name (bug, how_to, feature_request, ops_action, o
             return question_type
 
         except Exception as e:
-            logger.exception("Error classifying message", error=str(e))
+            self._log.exception("Error classifying message", error=str(e))
             return QuestionType.OTHER
+
+    async def _call_openai(self, prompt: str) -> str:
+        """Run a single classification prompt against OpenAI.
+
+        Args:
+            prompt: Classification prompt
+
+        Returns:
+            Raw model output
+        """
+        response = await self.client.chat.completions.create(
+            model=self.settings.llm_model,
+            messages=[
+                self.SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.1,
+            max_tokens=10,
+        )
+        return response.choices[0].message.content
+
+    async def _call_anthropic(self, prompt: str) -> str:
+        """Run a single classification prompt against Anthropic.
+
+        Args:
+            prompt: Classification prompt
+
+        Returns:
+            Raw model output
+        """
+        response = await self.client.messages.create(
+            model=self.settings.llm_model,
+            max_tokens=10,
+            temperature=0.1,
+            messages=[
+                {"role": "user", "content": prompt},
+            ],
+        )
+        return response.content[0].text
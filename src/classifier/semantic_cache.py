@@ -0,0 +1,183 @@
+"""Embedding-similarity cache for question classification."""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+import numpy as np
+import structlog
+from openai import AsyncOpenAI
+
+from src.models.conversation import QuestionType
+
+logger = structlog.get_logger(__name__)
+
+
+class SemanticClassifierCache:
+    """Cache of classification labels keyed by message embedding similarity.
+
+    Embeddings are L2-normalized so an inner product is the cosine similarity.
+    Entries live in a growable matrix whose rows are recycled in LRU order once
+    ``max_entries`` is reached.
+    """
+
+    BATCH_WINDOW_SECONDS = 0.05
+    MAX_BATCH_SIZE = 64
+    INITIAL_CAPACITY = 256
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        threshold: float = 0.9,
+        max_entries: int = 10_000,
+        ttl_seconds: int = 3600,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: OpenAI client used for embedding requests
+            model: Embeddings model name
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached labels
+            ttl_seconds: Lifetime of a cached label in seconds
+        """
+        self.client = client
+        self.model = model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._vectors: np.ndarray | None = None
+        self._expires = np.zeros(0, dtype=np.float64)
+        self._labels: list[QuestionType | None] = []
+        self._size = 0
+        self._lru: OrderedDict[int, None] = OrderedDict()
+
+        self._pending: list[tuple[str, asyncio.Future[np.ndarray]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a message, coalescing concurrent callers into one request.
+
+        Args:
+            text: Message text
+
+        Returns:
+            L2-normalized embedding vector
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.MAX_BATCH_SIZE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.BATCH_WINDOW_SECONDS, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending texts as a single embeddings request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._embed_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batch(self, batch: list[tuple[str, asyncio.Future[np.ndarray]]]) -> None:
+        """Resolve a batch of pending embedding futures.
+
+        Args:
+            batch: Pending (text, future) pairs
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=[text for text, _ in batch],
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), item in zip(batch, response.data):
+            vector = np.asarray(item.embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector /= norm
+            if not future.done():
+                future.set_result(vector)
+
+        logger.debug("Embedded classifier batch", batch_size=len(batch))
+
+    def lookup(self, embedding: np.ndarray) -> QuestionType | None:
+        """Find the cached label of the most similar live entry.
+
+        Args:
+            embedding: Normalized message embedding
+
+        Returns:
+            Cached question type, or None on a miss
+        """
+        if not self._lru or self._vectors is None:
+            return None
+
+        scores = self._vectors[: self._size] @ embedding
+        scores[self._expires[: self._size] <= time.monotonic()] = -np.inf
+
+        slot = int(np.argmax(scores))
+        if scores[slot] < self.threshold:
+            return None
+
+        self._lru.move_to_end(slot)
+        return self._labels[slot]
+
+    def insert(self, embedding: np.ndarray, label: QuestionType) -> None:
+        """Cache a label for an embedding, evicting the LRU entry when full.
+
+        Args:
+            embedding: Normalized message embedding
+            label: Classified question type
+        """
+        if self._vectors is None:
+            capacity = min(self.INITIAL_CAPACITY, self.max_entries)
+            self._vectors = np.zeros((capacity, embedding.shape[0]), dtype=np.float32)
+            self._expires = np.zeros(capacity, dtype=np.float64)
+            self._labels = [None] * capacity
+
+        if self._size < self.max_entries:
+            if self._size == len(self._labels):
+                self._grow()
+            slot = self._size
+            self._size += 1
+        else:
+            slot, _ = self._lru.popitem(last=False)
+
+        self._vectors[slot] = embedding
+        self._expires[slot] = time.monotonic() + self.ttl_seconds
+        self._labels[slot] = label
+        self._lru[slot] = None
+
+    def _grow(self) -> None:
+        """Double the backing storage, capped at ``max_entries``."""
+        capacity = min(len(self._labels) * 2, self.max_entries)
+        vectors = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        expires = np.zeros(capacity, dtype=np.float64)
+        expires[: self._size] = self._expires[: self._size]
+
+        self._vectors = vectors
+        self._expires = expires
+        self._labels.extend([None] * (capacity - len(self._labels)))
@@ -1,15 +1,34 @@
 """Channel configuration management."""
 
+import asyncio
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import structlog
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+logger = structlog.get_logger(__name__)
+
+# Tier used for metrics from channels without a configured tier
+DEFAULT_CHANNEL_TIER = "other"
 
 
 class RetrievalParams(BaseModel):
     """RAG retrieval parameters for a channel."""
 
+    model_config = ConfigDict(frozen=True)
+
     top_k: int = Field(default=5, ge=1, le=20)
     filters: dict[str, Any] = Field(default_factory=dict)
     similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
@@ -19,6 +38,8 @@ class RetrievalParams(BaseModel):
 class ChannelPolicies(BaseModel):
     """Policies for a channel."""
 
+    model_config = ConfigDict(frozen=True)
+
     pii_redaction: bool = True
     action_whitelist: list[str] = Field(default_factory=list)
     require_approval: bool = True
@@ -28,9 +49,12 @@ class ChannelPolicies(BaseModel):
 class ChannelConfig(BaseModel):
     """Configuration for a single Slack channel."""
 
+    model_config = ConfigDict(frozen=True)
+
     channel_id: str
     name: str
     rag_index: str
+    tier: str = DEFAULT_CHANNEL_TIER
     retrieval_params: RetrievalParams = Field(default_factory=RetrievalParams)
     approvers: list[str] = Field(default_factory=list)
     sla_minutes: int = Field(default=120, ge=1)
@@ -39,35 +63,139 @@ class ChannelConfig(BaseModel):
     enabled: bool = True
 
 
+class _ConfigFileHandler(FileSystemEventHandler):
+    """Forward changes to the channel config file onto the event loop."""
+
+    def __init__(self, manager: "ChannelConfigManager", loop: asyncio.AbstractEventLoop) -> None:
+        self._manager = manager
+        self._loop = loop
+        self._path = str(manager.config_path.resolve())
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Handle a filesystem event from the observer thread."""
+        # Editors often save by writing a temp file and renaming it over the original
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(path and str(Path(path).resolve()) == self._path for path in paths):
+            self._loop.call_soon_threadsafe(self._manager._schedule_reload)
+
+
 class ChannelConfigManager:
     """Manager for channel configurations."""
 
+    RELOAD_DEBOUNCE_SECONDS = 0.5
+
     def __init__(self, config_path: str | Path = "config/channels.yaml") -> None:
         """Initialize the channel config manager.
 
         Args:
             config_path: Path to the channels configuration file
         """
-        self.config_path = Path(config_path)
-        self._channels: dict[str, ChannelConfig] = {}
+        self._init_state(config_path)
         self._load_config()
 
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        config_path: str | Path = "config/channels.yaml",
+    ) -> "ChannelConfigManager":
+        """Create a manager from already parsed configuration data.
+
+        Args:
+            data: Configuration in the same shape as the YAML file
+            config_path: Path used by later reloads and file watching
+
+        Returns:
+            Channel config manager loaded without reading the file
+        """
+        manager = cls.__new__(cls)
+        manager._init_state(config_path)
+        manager._set_channels(cls._parse_channels(data), mtime_ns=None)
+        return manager
+
+    def _init_state(self, config_path: str | Path) -> None:
+        """Set up an empty manager for a config file.
+
+        Args:
+            config_path: Path to the channels configuration file
+        """
+        self.config_path = Path(config_path)
+        self._channels: Mapping[str, ChannelConfig] = MappingProxyType({})
+        self._channels_list: tuple[ChannelConfig, ...] = ()
+        self._enabled_ids: frozenset[str] = frozenset()
+        self._mtime_ns: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._observer: Observer | None = None
+        self._reload_handle: asyncio.TimerHandle | None = None
+
     def _load_config(self) -> None:
         """Load channel configurations from YAML file."""
+        mtime_ns = self._stat_mtime()
+        self._set_channels(self._read_channels(), mtime_ns)
+
+    def _set_channels(self, channels: dict[str, ChannelConfig], mtime_ns: int | None) -> None:
+        """Replace the loaded channel configurations.
+
+        The mapping is read-only and replaced as a whole, so lookups never
+        observe a partially loaded configuration.
+
+        Args:
+            channels: Channel configurations keyed by channel ID
+            mtime_ns: Modification time of the file they were read from
+        """
+        self._mtime_ns = mtime_ns
+        self._channels = MappingProxyType(channels)
+        self._channels_list = tuple(channels.values())
+        self._enabled_ids = frozenset(
+            channel_id for channel_id, config in channels.items() if config.enabled
+        )
+
+    def _stat_mtime(self) -> int | None:
+        """Get the config file modification time.
+
+        Returns:
+            Modification time in nanoseconds or None if the file is missing
+        """
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _read_channels(self) -> dict[str, ChannelConfig]:
+        """Read channel configurations from the YAML file.
+
+        Returns:
+            Channel configurations keyed by channel ID
+        """
         if not self.config_path.exists():
             # Create default config if it doesn't exist
             self._create_default_config()
-            return
+            return {}
 
         with open(self.config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
+
+        return self._parse_channels(data)
 
+    @staticmethod
+    def _parse_channels(data: Mapping[str, Any] | None) -> dict[str, ChannelConfig]:
+        """Validate parsed configuration data.
+
+        Args:
+            data: Configuration in the same shape as the YAML file
+
+        Returns:
+            Channel configurations keyed by channel ID
+        """
         if not data or "channels" not in data:
-            return
+            return {}
 
+        channels = {}
         for channel_data in data["channels"]:
             config = ChannelConfig(**channel_data)
-            self._channels[config.channel_id] = config
+            channels[config.channel_id] = config
+
+        return channels
 
     def _create_default_config(self) -> None:
         """Create a default configuration file."""
@@ -77,6 +205,7 @@ class ChannelConfigManager:
                     "channel_id": "C_EXAMPLE",
                     "name": "example-channel",
                     "rag_index": "kb-example",
+                    "tier": DEFAULT_CHANNEL_TIER,
                     "retrieval_params": {
                         "top_k": 5,
                         "filters": {},
@@ -98,7 +227,13 @@ class ChannelConfigManager:
 
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, "w", encoding="utf-8") as f:
-            yaml.dump(default_config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                default_config,
+                f,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
     def get_channel_config(self, channel_id: str) -> ChannelConfig | None:
         """Get configuration for a specific channel.
@@ -120,18 +255,85 @@ class ChannelConfigManager:
         Returns:
             True if channel is enabled, False otherwise
         """
-        config = self.get_channel_config(channel_id)
-        return config is not None and config.enabled
+        return channel_id in self._enabled_ids
+
+    def get_tier(self, channel_id: str) -> str:
+        """Get the metrics tier for a channel.
+
+        Args:
+            channel_id: Slack channel ID
+
+        Returns:
+            Configured tier, or the default tier for unknown channels
+        """
+        config = self._channels.get(channel_id)
+        return config.tier if config is not None else DEFAULT_CHANNEL_TIER
 
-    def list_channels(self) -> list[ChannelConfig]:
+    def list_channels(self) -> tuple[ChannelConfig, ...]:
         """List all configured channels.
 
         Returns:
-            List of channel configurations
+            Tuple of channel configurations
         """
-        return list(self._channels.values())
+        return self._channels_list
 
     def reload(self) -> None:
         """Reload configurations from file."""
-        self._channels.clear()
         self._load_config()
+
+    def start_watching(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Reload automatically when the config file changes.
+
+        Args:
+            loop: Event loop that reloads are scheduled on
+        """
+        if self._observer is not None:
+            return
+
+        self._loop = loop
+        self._observer = Observer()
+        # Watch the directory so atomic-rename saves are still seen
+        self._observer.schedule(
+            _ConfigFileHandler(self, loop),
+            str(self.config_path.parent),
+            recursive=False,
+        )
+        self._observer.daemon = True
+        self._observer.start()
+
+        logger.info("Watching channel config for changes", path=str(self.config_path))
+
+    def stop_watching(self) -> None:
+        """Stop watching the config file."""
+        if self._reload_handle is not None:
+            self._reload_handle.cancel()
+            self._reload_handle = None
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+            self._observer = None
+
+    def _schedule_reload(self) -> None:
+        """Debounce a reload so bursts of file events trigger one parse."""
+        if self._reload_handle is not None:
+            self._reload_handle.cancel()
+
+        self._reload_handle = self._loop.call_later(
+            self.RELOAD_DEBOUNCE_SECONDS,
+            self._reload_if_changed,
+        )
+
+    def _reload_if_changed(self) -> None:
+        """Reload the config if the file was modified since the last load."""
+        self._reload_handle = None
+
+        if self._stat_mtime() == self._mtime_ns:
+            return
+
+        try:
+            self.reload()
+            logger.info("Channel config reloaded", channels=len(self._channels_list))
+        except Exception as e:
+            # Keep serving the previous config until the file is valid again
+            logger.exception("Failed to reload channel config", error=str(e))
@@ -1,5 +1,6 @@
 """Application settings and configuration."""
 
+from dataclasses import dataclass, fields
 from functools import lru_cache
 from typing import Literal
 
@@ -41,6 +42,12 @@ class Settings(BaseSettings):
     embeddings_model: str = "text-embedding-3-small"
     embeddings_dimension: int = 1536
 
+    # Classifier Cache Configuration
+    classifier_cache_enabled: bool = True
+    classifier_cache_threshold: float = Field(default=0.9, ge=0.0, le=1.0)
+    classifier_cache_max_entries: int = Field(default=10000, ge=1)
+    classifier_cache_ttl_seconds: int = Field(default=3600, ge=1)
+
     # Vector Database Configuration
     vector_db_provider: Literal["pinecone", "chromadb", "faiss"] = "pinecone"
     pinecone_api_key: SecretStr | None = None
@@ -64,6 +71,17 @@ class Settings(BaseSettings):
 
     # Database Configuration
     database_url: str = "sqlite+aiosqlite:///./slack_rag_assistant.db"
+    db_pool_size: int = Field(default=50, ge=1, description="PostgreSQL connection pool size")
+    db_max_overflow: int = Field(
+        default=50, ge=0, description="Connections allowed above the pool size"
+    )
+    db_pool_recycle_seconds: int = Field(default=1800, ge=1)
+    db_read_pool_size: int = Field(
+        default=5, ge=1, description="Autocommit pool for dashboard reads (PostgreSQL only)"
+    )
+    db_statement_cache_size: int = Field(
+        default=500, ge=0, description="asyncpg prepared statement cache; 0 behind PgBouncer"
+    )
 
     # Security Configuration
     encryption_key: SecretStr | None = None
@@ -84,6 +102,10 @@ class Settings(BaseSettings):
     rate_limit_per_user: int = Field(default=10, ge=1)
     rate_limit_window_seconds: int = Field(default=60, ge=1)
 
+    # Message Processing
+    message_worker_count: int = Field(default=8, ge=1)
+    message_queue_size: int = Field(default=1000, ge=1)
+
     # RAG Configuration
     rag_retrieval_top_k: int = Field(default=5, ge=1, le=20)
     rag_similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
@@ -106,6 +128,63 @@ class Settings(BaseSettings):
         return self.environment == "production"
 
 
+@dataclass(frozen=True, slots=True)
+class RuntimeSettings:
+    """Immutable snapshot of the settings read by integrations on hot paths.
+
+    Plain slotted attributes avoid going through the pydantic model on every
+    access. Use ``get_settings()`` where the full settings model is needed.
+    """
+
+    # LLM
+    llm_provider: str
+    llm_model: str
+    llm_temperature: float
+    llm_max_tokens: int
+    openai_api_key: SecretStr | None
+    anthropic_api_key: SecretStr | None
+
+    # Embeddings and classifier cache
+    embeddings_provider: str
+    embeddings_model: str
+    classifier_cache_enabled: bool
+    classifier_cache_threshold: float
+    classifier_cache_max_entries: int
+    classifier_cache_ttl_seconds: int
+
+    # Jira
+    jira_url: str | None
+    jira_username: str | None
+    jira_api_token: SecretStr | None
+    jira_project_key: str
+    jira_issue_type: str
+
+    # Email
+    smtp_host: str
+    smtp_port: int
+    smtp_username: str | None
+    smtp_password: SecretStr | None
+    smtp_from_email: str | None
+    smtp_use_tls: bool
+
+    # RAG
+    rag_retrieval_top_k: int
+    rag_similarity_threshold: float
+    rag_max_context_length: int
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RuntimeSettings":
+        """Snapshot the hot-path fields of a settings instance.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            Runtime settings snapshot
+        """
+        return cls(**{field.name: getattr(settings, field.name) for field in fields(cls)})
+
+
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
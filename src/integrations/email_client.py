@@ -1,11 +1,13 @@
 """Email integration client."""
 
+import asyncio
+from string import Template
+
 import structlog
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import aiosmtplib
 
-from src.config.settings import Settings
+from src.config.settings import RuntimeSettings
 
 logger = structlog.get_logger(__name__)
 
@@ -13,13 +15,104 @@ logger = structlog.get_logger(__name__)
 class EmailClient:
     """Client for sending escalation emails."""
 
-    def __init__(self, settings: Settings) -> None:
+    KEEPALIVE_INTERVAL_SECONDS = 60
+
+    _BODY_TEMPLATE = Template(
+        """
+Slack RAG Assistant - Escalation Notice
+
+Summary:
+$summary
+
+This conversation has been escalated due to SLA breach or complexity.
+
+Slack Thread: $thread_url
+$jira_line
+Please review and take appropriate action.
+
+---
+This is an automated message from Slack RAG Assistant.
+"""
+    )
+
+    def __init__(self, settings: RuntimeSettings) -> None:
         """Initialize email client.
 
         Args:
-            settings: Application settings
+            settings: Runtime settings snapshot
         """
         self.settings = settings
+        self._log = logger.bind(component="email_client", smtp_host=settings.smtp_host)
+        self._from_email = settings.smtp_from_email or settings.smtp_username
+        self._smtp_password = (
+            settings.smtp_password.get_secret_value() if settings.smtp_password else None
+        )
+
+        # A single SMTP session is reused across sends so bursts of
+        # escalations don't each pay for a TCP + TLS handshake
+        self._smtp = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            use_tls=settings.smtp_use_tls,
+        )
+        self._smtp_lock = asyncio.Lock()
+        self._keepalive_task: asyncio.Task | None = None
+
+    async def _ensure_connected(self) -> None:
+        """Connect and authenticate the SMTP session if it is not already open.
+
+        Must be called with the SMTP lock held.
+        """
+        if self._smtp.is_connected:
+            return
+
+        await self._smtp.connect()
+        try:
+            if self.settings.smtp_username:
+                await self._smtp.login(self.settings.smtp_username, self._smtp_password or "")
+        except Exception:
+            # Don't leave a connected but unauthenticated session for the next send
+            self._smtp.close()
+            raise
+
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+
+        self._log.info("SMTP connection established")
+
+    async def _keepalive(self) -> None:
+        """Periodically send NOOP so the server doesn't drop the idle session."""
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL_SECONDS)
+
+            async with self._smtp_lock:
+                if not self._smtp.is_connected:
+                    continue
+
+                try:
+                    await self._smtp.noop()
+                except aiosmtplib.SMTPException as e:
+                    self._log.warning("SMTP keepalive failed", error=str(e))
+                    self._smtp.close()
+
+    async def _send(self, message: MIMEText) -> None:
+        """Send a message over the shared SMTP session.
+
+        Reconnects once if the server has dropped the connection.
+
+        Args:
+            message: Message to send
+        """
+        async with self._smtp_lock:
+            await self._ensure_connected()
+
+            try:
+                await self._smtp.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                self._log.info("SMTP connection lost, reconnecting")
+                self._smtp.close()
+                await self._ensure_connected()
+                await self._smtp.send_message(message)
 
     async def send_escalation(
         self,
@@ -41,53 +134,43 @@ class EmailClient:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("Sending escalation email", to_email=to_email)
+        self._log.info("Sending escalation email", to_email=to_email)
 
         try:
+            jira_line = (
+                f"\nJira Issue: {self.settings.jira_url}/browse/{jira_key}\n" if jira_key else ""
+            )
+            body = self._BODY_TEMPLATE.substitute(
+                summary=summary,
+                thread_url=thread_url,
+                jira_line=jira_line,
+            )
+
             # Create message
-            message = MIMEMultipart("alternative")
-            message["From"] = self.settings.smtp_from_email or self.settings.smtp_username
+            message = MIMEText(body, "plain", "utf-8")
+            message["From"] = self._from_email
             message["To"] = to_email
             message["Subject"] = subject
 
-            # Create email body
-            text_body = f"""
-Slack RAG Assistant - Escalation Notice
-
-Summary:
-{summary}
-
-This conversation has been escalated due to SLA breach or complexity.
-
-Slack Thread: {thread_url}
-"""
-
-            if jira_key:
-                text_body += f"\nJira Issue: {self.settings.jira_url}/browse/{jira_key}\n"
-
-            text_body += """
-Please review and take appropriate action.
-
----
-This is an automated message from Slack RAG Assistant.
-"""
-
-            # Attach text body
-            message.attach(MIMEText(text_body, "plain"))
-
             # Send email
-            await aiosmtplib.send(
-                message,
-                hostname=self.settings.smtp_host,
-                port=self.settings.smtp_port,
-                username=self.settings.smtp_username,
-                password=self.settings.smtp_password.get_secret_value() if self.settings.smtp_password else None,
-                use_tls=self.settings.smtp_use_tls,
-            )
+            await self._send(message)
 
-            logger.info("Escalation email sent successfully", to_email=to_email)
+            self._log.info("Escalation email sent successfully", to_email=to_email)
             return True
 
         except Exception as e:
-            logger.exception("Failed to send escalation email", error=str(e))
+            self._log.exception("Failed to send escalation email", error=str(e))
             return False
+
+    async def close(self) -> None:
+        """Stop the keepalive task and close the SMTP session."""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
+        async with self._smtp_lock:
+            if self._smtp.is_connected:
+                try:
+                    await self._smtp.quit()
+                except aiosmtplib.SMTPException:
+                    self._smtp.close()
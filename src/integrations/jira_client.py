@@ -1,10 +1,9 @@
 """Jira integration client."""
 
+import httpx
 import structlog
-from jira import JIRA
-from jira.exceptions import JIRAError
 
-from src.config.settings import Settings
+from src.config.settings import RuntimeSettings
 
 logger = structlog.get_logger(__name__)
 
@@ -12,31 +11,34 @@ logger = structlog.get_logger(__name__)
 class JiraClient:
     """Client for Jira integration."""
 
-    def __init__(self, settings: Settings) -> None:
+    API_PREFIX = "/rest/api/2"
+
+    def __init__(self, settings: RuntimeSettings) -> None:
         """Initialize Jira client.
 
         Args:
-            settings: Application settings
+            settings: Runtime settings snapshot
         """
         self.settings = settings
+        self._log = logger.bind(component="jira_client", server=settings.jira_url)
 
         if not settings.jira_url:
-            logger.warning("Jira URL not configured")
+            self._log.warning("Jira URL not configured")
             self.client = None
             return
 
-        try:
-            self.client = JIRA(
-                server=settings.jira_url,
-                basic_auth=(
-                    settings.jira_username,
-                    settings.jira_api_token.get_secret_value() if settings.jira_api_token else "",
-                ),
-            )
-            logger.info("Jira client initialized", server=settings.jira_url)
-        except JIRAError as e:
-            logger.exception("Failed to initialize Jira client", error=str(e))
-            self.client = None
+        self._jira_token = (
+            settings.jira_api_token.get_secret_value() if settings.jira_api_token else None
+        )
+
+        self.client = httpx.AsyncClient(
+            base_url=settings.jira_url,
+            auth=(settings.jira_username or "", self._jira_token or ""),
+            headers={"Accept": "application/json"},
+            http2=True,
+            timeout=30,
+        )
+        self._log.info("Jira client initialized")
 
     async def create_issue(
         self,
@@ -57,7 +59,7 @@ class JiraClient:
             Jira issue key or None if failed
         """
         if not self.client:
-            logger.warning("Jira client not initialized")
+            self._log.warning("Jira client not initialized")
             return None
 
         try:
@@ -71,18 +73,23 @@ class JiraClient:
             if labels:
                 issue_dict["labels"] = labels
 
-            issue = self.client.create_issue(fields=issue_dict)
+            response = await self.client.post(
+                f"{self.API_PREFIX}/issue",
+                json={"fields": issue_dict},
+            )
+            response.raise_for_status()
+            issue_key = response.json()["key"]
 
-            logger.info(
+            self._log.info(
                 "Jira issue created",
-                issue_key=issue.key,
+                issue_key=issue_key,
                 summary=summary,
             )
 
-            return issue.key
+            return issue_key
 
-        except JIRAError as e:
-            logger.exception("Failed to create Jira issue", error=str(e))
+        except httpx.HTTPError as e:
+            self._log.exception("Failed to create Jira issue", error=str(e))
             return None
 
     async def update_issue(
@@ -102,21 +109,32 @@ class JiraClient:
             True if successful, False otherwise
         """
         if not self.client:
-            logger.warning("Jira client not initialized")
+            self._log.warning("Jira client not initialized")
             return False
 
         try:
-            issue = self.client.issue(issue_key)
-
             if comment:
-                self.client.add_comment(issue, comment)
+                response = await self.client.post(
+                    f"{self.API_PREFIX}/issue/{issue_key}/comment",
+                    json={"body": comment},
+                )
+                response.raise_for_status()
 
             if fields:
-                issue.update(fields=fields)
+                response = await self.client.put(
+                    f"{self.API_PREFIX}/issue/{issue_key}",
+                    json={"fields": fields},
+                )
+                response.raise_for_status()
 
-            logger.info("Jira issue updated", issue_key=issue_key)
+            self._log.info("Jira issue updated", issue_key=issue_key)
             return True
 
-        except JIRAError as e:
-            logger.exception("Failed to update Jira issue", error=str(e))
+        except httpx.HTTPError as e:
+            self._log.exception("Failed to update Jira issue", error=str(e))
             return False
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        if self.client:
+            await self.client.aclose()
@@ -0,0 +1,41 @@
+"""Shared LLM API clients."""
+
+from functools import lru_cache
+
+import anthropic
+import httpx
+import openai
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+# Keep enough idle connections for concurrent classifier, RAG and summary calls
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+
+@lru_cache
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get the shared OpenAI client for an API key.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        Cached OpenAI client
+    """
+    # The SDK's client subclass keeps its default timeouts and keepalive options
+    http_client = openai.DefaultAsyncHttpxClient(http2=True, limits=HTTP_LIMITS)
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+@lru_cache
+def get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Get the shared Anthropic client for an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Cached Anthropic client
+    """
+    http_client = anthropic.DefaultAsyncHttpxClient(http2=True, limits=HTTP_LIMITS)
+    return AsyncAnthropic(api_key=api_key, http_client=http_client)
@@ -1,20 +1,33 @@
 """Main application entry point for the Slack RAG Assistant."""
 
+from __future__ import annotations
+
 import asyncio
 import signal
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 import uvicorn
-from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
-from slack_bolt.async_app import AsyncApp
+from sqlalchemy import func, select
 
 from src.config.settings import get_settings
+from src.models.base import engine, warm_pool
+from src.models.conversation import Conversation, ConversationStatus
 from src.observability.logging import setup_logging
-from src.observability.metrics import setup_metrics
+from src.observability.metrics import active_conversations, setup_metrics
+from src.observability.metrics_queue import stop_metrics_drain
 from src.slack.bot import create_slack_app
+from src.slack.services.message_queue import stop_message_workers
+
+if TYPE_CHECKING:
+    from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+    from slack_bolt.async_app import AsyncApp
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
 logger = structlog.get_logger(__name__)
 
@@ -22,12 +35,16 @@ logger = structlog.get_logger(__name__)
 class Application:
     """Main application class."""
 
+    SHUTDOWN_TIMEOUT_SECONDS = 10
+
     def __init__(self) -> None:
         """Initialize the application."""
         self.settings = get_settings()
         self.app: AsyncApp | None = None
         self.handler: AsyncSocketModeHandler | None = None
         self.web_server: Any = None
+        self._bot_task: asyncio.Task | None = None
+        self._web_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
 
     async def setup(self) -> None:
@@ -38,8 +55,17 @@ class Application:
         setup_logging(self.settings)
         setup_metrics(self.settings)
 
-        # Create Slack app
-        self.app = await create_slack_app(self.settings)
+        # Create Slack app while connection pools warm up
+        self.app, _ = await asyncio.gather(
+            create_slack_app(self.settings),
+            self._warm_clients(),
+        )
+
+        # Pick up channel config edits without a restart
+        self.app.client.channel_manager.start_watching(asyncio.get_running_loop())
+
+        # Deferred like the imports in create_slack_app
+        from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 
         # Create socket mode handler
         self.handler = AsyncSocketModeHandler(
@@ -49,6 +75,24 @@ class Application:
 
         logger.info("Application setup complete")
 
+    async def _warm_clients(self) -> None:
+        """Open pooled connections ahead of the first request.
+
+        The warm-up query also seeds the active conversations gauge.
+        """
+        try:
+            await warm_pool()
+            async with engine.connect() as conn:
+                active = await conn.scalar(
+                    select(func.count())
+                    .select_from(Conversation)
+                    .where(Conversation.status == ConversationStatus.ACTIVE)
+                )
+            active_conversations.set(active)
+            logger.info("Database connection pool warmed", active_conversations=active)
+        except Exception as e:
+            logger.warning("Failed to warm database connection pool", error=str(e))
+
     async def run(self) -> None:
         """Run the application."""
         if not self.handler:
@@ -56,18 +100,18 @@ class Application:
 
         logger.info("Starting Slack bot and web dashboard")
 
-        # Start Slack bot in background
-        bot_task = asyncio.create_task(self.handler.start_async())
-
-        # Start web dashboard
         config = uvicorn.Config(
             "src.web.app:app",
             host="0.0.0.0",
             port=8080,
             log_level="info",
         )
-        server = uvicorn.Server(config)
-        web_task = asyncio.create_task(server.serve())
+        self.web_server = uvicorn.Server(config)
+
+        # Start Slack bot and web dashboard together
+        self._bot_task = asyncio.create_task(self.handler.start_async())
+        self._web_task = asyncio.create_task(self.web_server.serve())
+        services = asyncio.gather(self._bot_task, self._web_task)
 
         logger.info(
             "Services started",
@@ -75,35 +119,66 @@ class Application:
             metrics="http://localhost:9090/metrics",
         )
 
-        # Wait for shutdown signal
-        await self._shutdown_event.wait()
+        # Wait for shutdown signal, or for a service to exit on its own
+        shutdown_wait = asyncio.create_task(self._shutdown_event.wait())
+        await asyncio.wait({services, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED)
 
-        # Cancel tasks
-        bot_task.cancel()
-        web_task.cancel()
+        if self._shutdown_event.is_set():
+            logger.info("Received shutdown signal")
+
+        # Services are stopped in shutdown()
+        shutdown_wait.cancel()
+        if services.done():
+            # Surface the error from a service that stopped unexpectedly
+            services.result()
 
     async def shutdown(self) -> None:
         """Gracefully shutdown the application."""
         logger.info("Shutting down application")
 
+        if self.app:
+            self.app.client.channel_manager.stop_watching()
+
+        # Let uvicorn drain connections and close its sockets itself
+        if self.web_server:
+            self.web_server.should_exit = True
+
+        # The Socket Mode handler idles forever once connected
+        if self._bot_task:
+            self._bot_task.cancel()
+
+        pending = [task for task in (self._bot_task, self._web_task) if task]
         if self.handler:
-            await self.handler.close_async()
+            pending.append(self.handler.close_async())
 
-        logger.info("Application shutdown complete")
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*pending, return_exceptions=True),
+                timeout=self.SHUTDOWN_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            # wait_for cancels whatever is still running
+            logger.warning(
+                "Shutdown timed out, cancelled remaining tasks",
+                timeout=self.SHUTDOWN_TIMEOUT_SECONDS,
+            )
+
+        # Finish responses for messages that were already accepted
+        await stop_message_workers(self.SHUTDOWN_TIMEOUT_SECONDS)
 
-    def handle_signal(self, signum: int, frame: Any) -> None:
-        """Handle shutdown signals."""
-        logger.info("Received shutdown signal", signal=signum)
-        self._shutdown_event.set()
+        await stop_metrics_drain()
+
+        logger.info("Application shutdown complete")
 
 
 async def main() -> None:
     """Main entry point."""
     app = Application()
 
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, app.handle_signal)
-    signal.signal(signal.SIGTERM, app.handle_signal)
+    # Set up signal handlers on the event loop so they wake it directly
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, app._shutdown_event.set)
 
     try:
         await app.setup()
@@ -116,4 +191,8 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvicorn serves inside this loop, so the loop is chosen here rather than in its config
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
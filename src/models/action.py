@@ -1,12 +1,13 @@
 """Action execution models."""
 
+from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
 from sqlalchemy import ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.base import Base
+from src.models.base import Base, OrjsonText
 
 if TYPE_CHECKING:
     from src.models.conversation import Conversation
@@ -36,7 +37,7 @@ class ActionRun(Base):
     )
 
     action_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    parameters: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
+    parameters: Mapped[dict | None] = mapped_column(OrjsonText, nullable=True)
 
     status: Mapped[ActionStatus] = mapped_column(
         default=ActionStatus.PENDING_APPROVAL,
@@ -45,14 +46,14 @@ class ActionRun(Base):
     )
 
     approved_by: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    approved_at: Mapped[str | None] = mapped_column(nullable=True)
+    approved_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     output: Mapped[str | None] = mapped_column(Text, nullable=True)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
-    logs: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array
+    logs: Mapped[list | None] = mapped_column(OrjsonText, nullable=True)
 
-    started_at: Mapped[str | None] = mapped_column(nullable=True)
-    completed_at: Mapped[str | None] = mapped_column(nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(nullable=True, index=True)
     duration_seconds: Mapped[float | None] = mapped_column(nullable=True)
 
     # Relationship
@@ -1,27 +1,87 @@
 """Audit event models."""
 
-from sqlalchemy import String, Text
+import hashlib
+from typing import Any
+
+import orjson
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.models.base import Base
+from src.models.base import Base, OrjsonText
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Copying a primed hasher skips per-call constructor lookup
+_SHA256 = hashlib.sha256()
+
+
+def hash_payload(data: bytes) -> str:
+    """Hash a serialized audit payload.
+
+    Uses BLAKE3 when the optional blake3 package is installed and SHA-256
+    otherwise. Both produce a 64-character hex digest.
+
+    Args:
+        data: Serialized payload bytes
+
+    Returns:
+        Hex digest of the payload
+    """
+    if _blake3 is not None:
+        return _blake3(data).hexdigest()
+
+    hasher = _SHA256.copy()
+    hasher.update(data)
+    return hasher.hexdigest()
 
 
 class AuditEvent(Base):
     """Audit event model for tracking all system events."""
 
     __tablename__ = "audit_events"
+    __table_args__ = (
+        Index("ix_audit_channel_thread_type", "channel_id", "thread_ts", "event_type"),
+        # Newest-first listing, unfiltered and filtered by event type
+        Index("ix_audit_created", "created_at"),
+        Index("ix_audit_type_created", "event_type", "created_at"),
+    )
 
-    event_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
     actor_id: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
 
-    channel_id: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
+    channel_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
     thread_ts: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
 
-    payload: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
+    payload: Mapped[dict | None] = mapped_column(OrjsonText, nullable=True)
     payload_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     result: Mapped[str | None] = mapped_column(String(50), nullable=True)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    @classmethod
+    def from_payload(cls, event_type: str, payload: dict[str, Any], **kwargs: Any) -> "AuditEvent":
+        """Create an audit event with a hashed payload.
+
+        The hash is taken over orjson output, the same encoding OrjsonText
+        uses for storage, so it always matches the stored JSON.
+
+        Args:
+            event_type: Type of event
+            payload: Event payload
+            **kwargs: Additional column values
+
+        Returns:
+            New audit event
+        """
+        return cls(
+            event_type=event_type,
+            payload=payload,
+            payload_hash=hash_payload(orjson.dumps(payload)),
+            **kwargs,
+        )
+
     def __repr__(self) -> str:
         return f"<AuditEvent(id={self.id}, type={self.event_type}, actor={self.actor_id})>"
@@ -1,13 +1,16 @@
 """Base database models and session management."""
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import MetaData, func
+import orjson
+from sqlalchemy import MetaData, QueuePool, Text, event, func, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
 
 
 # Naming convention for constraints
@@ -22,6 +25,25 @@ convention = {
 metadata = MetaData(naming_convention=convention)
 
 
+class OrjsonText(TypeDecorator):
+    """Text column storing JSON-serializable values, encoded with orjson."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> str | None:
+        """Serialize a Python value for storage."""
+        if value is None:
+            return None
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value: str | None, dialect: Any) -> Any:
+        """Deserialize a stored value."""
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
@@ -51,13 +73,73 @@ class Base(DeclarativeBase):
         }
 
 
+def _engine_options(settings: Settings, read_only: bool = False) -> dict[str, Any]:
+    """Build engine keyword arguments for the configured database.
+
+    Args:
+        settings: Application settings
+        read_only: Build options for the autocommit dashboard read engine
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    options: dict[str, Any] = {"echo": settings.debug, "pool_pre_ping": True}
+
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == "postgresql":
+        if read_only:
+            options.update(
+                isolation_level="AUTOCOMMIT",
+                pool_size=settings.db_read_pool_size,
+                max_overflow=0,
+            )
+        else:
+            # Sized for bursts of Slack events so handlers don't queue for connections
+            options.update(
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+            )
+        options["pool_recycle"] = settings.db_pool_recycle_seconds
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                # JIT compilation only slows down the short queries the bot runs
+                "server_settings": {"jit": "off"},
+                # Reuse server-side prepared statements for the fixed set of queries
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+                "statement_cache_size": settings.db_statement_cache_size,
+            }
+
+    return options
+
+
+# WAL lets dashboard reads run alongside bot writes, and with WAL synchronous=NORMAL
+# only syncs at checkpoints instead of on every commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply the SQLite tuning pragmas to a new connection.
+
+    Args:
+        dbapi_connection: Driver connection
+        connection_record: Pool connection record
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 # Database engine and session
 settings = get_settings()
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-)
+engine = create_async_engine(settings.database_url, **_engine_options(settings))
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -65,6 +147,21 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Dashboard reads are single SELECTs. On PostgreSQL a small autocommit pool saves
+# the BEGIN/ROLLBACK round trips around each one; SQLite has none to save.
+if make_url(settings.database_url).get_backend_name() == "postgresql":
+    read_engine = create_async_engine(
+        settings.database_url, **_engine_options(settings, read_only=True)
+    )
+else:
+    read_engine = engine
+
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_db() -> AsyncSession:
     """Get database session.
@@ -83,6 +180,23 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def warm_pool() -> None:
+    """Open the pool's connections up front so early requests don't pay for connecting."""
+    size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)),
+        return_exceptions=True,
+    )
+    await asyncio.gather(
+        *(conn.close() for conn in results if not isinstance(conn, BaseException))
+    )
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
@@ -92,3 +206,5 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
@@ -4,10 +4,10 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.base import Base
+from src.models.base import Base, OrjsonText
 
 if TYPE_CHECKING:
     from src.models.action import ActionRun
@@ -38,8 +38,23 @@ class Conversation(Base):
     """Conversation model representing a Slack thread."""
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Lookups on channel_id or status alone use the leading column of these
+        Index("ix_conv_channel_status", "channel_id", "status"),
+        Index("ix_conv_channel_thread", "channel_id", "thread_ts"),
+        Index("ix_conv_status_sla", "status", "sla_deadline"),
+        # Newest-first dashboard listing
+        Index("ix_conv_created", "created_at"),
+        # Per-channel active counts; enum columns store member names
+        Index(
+            "ix_conv_active_channel",
+            "channel_id",
+            postgresql_where=text("status = 'ACTIVE'"),
+            sqlite_where=text("status = 'ACTIVE'"),
+        ),
+    )
 
-    channel_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    channel_id: Mapped[str] = mapped_column(String(50), nullable=False)
     thread_ts: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
     user_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
 
@@ -47,7 +62,6 @@ class Conversation(Base):
     status: Mapped[ConversationStatus] = mapped_column(
         default=ConversationStatus.ACTIVE,
         nullable=False,
-        index=True,
     )
 
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -97,7 +111,7 @@ class Message(Base):
 
     # File attachments
     has_files: Mapped[bool] = mapped_column(default=False, nullable=False)
-    file_urls: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array
+    file_urls: Mapped[list[str] | None] = mapped_column(OrjsonText, nullable=True)
     ocr_text: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Bot response
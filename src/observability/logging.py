@@ -1,13 +1,71 @@
 """Logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import Processor
 
 from src.config.settings import Settings
+from src.observability.metrics import record_error
+
+# Records buffered for the writer thread before new ones are dropped
+LOG_QUEUE_SIZE = 20_000
+
+# Third-party loggers kept at WARNING regardless of the app log level
+_NOISY_LOGGERS = ("httpx", "httpcore", "urllib3", "asyncio")
+
+_listener: QueueListener | None = None
+_log_queue: queue.Queue | None = None
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking the caller."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            record_error("log_queue", "queue_full")
+
+
+def log_queue_depth() -> int:
+    """Get the number of log records waiting for the writer thread.
+
+    Returns:
+        Queued record count
+    """
+    return _log_queue.qsize() if _log_queue is not None else 0
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson.
+
+    Args:
+        obj: Event dict
+        **kwargs: JSONRenderer options; only ``default`` is used
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(settings: Settings) -> None:
@@ -18,26 +76,41 @@ def setup_logging(settings: Settings) -> None:
     """
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=log_level,
-    )
+    # Configure standard logging. Records are handed to a background thread
+    # so stdout writes never block the event loop.
+    global _listener, _log_queue
+    _stop_listener()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _log_queue = log_queue
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_listener)
 
-    # Silence noisy loggers
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, _DroppingQueueHandler):
+            root_logger.removeHandler(handler)
+    root_logger.addHandler(_DroppingQueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+
+    # Silence noisy loggers. The level check runs before a record is created,
+    # so their debug/info calls never reach the queue; warnings still do.
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
     logging.getLogger("slack_sdk").setLevel(logging.INFO)
 
-    # Configure structlog processors
+    # Configure structlog processors. Exception tracebacks are rendered by
+    # the environment-specific renderers below, not on every call.
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
 
     if settings.is_development:
@@ -52,12 +125,21 @@ def setup_logging(settings: Settings) -> None:
         # Production: JSON output
         processors = shared_processors + [
             structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
 
+    if settings.is_production:
+        # Calls below the configured level become no-ops before any processor runs
+        wrapper_class = structlog.make_filtering_bound_logger(log_level)
+    else:
+        # The stdlib wrapper only checks the level after the chain has run,
+        # so drop disabled calls (e.g. per-query RAG logs) up front
+        wrapper_class = structlog.stdlib.BoundLogger
+        processors = [structlog.stdlib.filter_by_level] + processors
+
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=wrapper_class,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -1,150 +1,242 @@
 """Prometheus metrics configuration."""
 
-from prometheus_client import Counter, Gauge, Histogram, start_http_server
+from functools import lru_cache
+from typing import Any
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    Summary,
+    start_http_server,
+)
 
 from src.config.settings import Settings
 
+# Bot metrics live in their own registry so scrapes only return these series,
+# not the default process/platform collectors or metrics from imported libraries
+REGISTRY = CollectorRegistry()
+
+# Metrics are labeled by channel tier (from channel config) rather than channel
+# ID so series count stays bounded as the bot joins more channels. Per-channel
+# detail is available in the structured logs.
 
 # Message metrics
 messages_received_total = Counter(
     "slack_rag_messages_received_total",
     "Total messages received",
-    ["channel_id", "message_type"],
+    ["channel_tier", "message_type"],
+    registry=REGISTRY,
 )
 
 messages_processed_total = Counter(
     "slack_rag_messages_processed_total",
     "Total messages processed",
-    ["channel_id", "status"],
+    ["channel_tier", "status"],
+    registry=REGISTRY,
 )
 
-# Response metrics
+# Response metrics. Latency buckets follow the response SLOs rather than a fine
+# grid: every bucket is its own series per label combination.
 response_time_seconds = Histogram(
     "slack_rag_response_time_seconds",
     "Response time in seconds",
-    ["channel_id", "response_type"],
-    buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0],
+    ["channel_tier", "response_type"],
+    buckets=[1.0, 5.0, 30.0, 120.0],
+    registry=REGISTRY,
 )
 
 first_response_time_seconds = Histogram(
     "slack_rag_first_response_time_seconds",
     "First response time in seconds",
-    ["channel_id"],
-    buckets=[1.0, 3.0, 5.0, 10.0, 15.0, 30.0, 60.0],
+    ["channel_tier"],
+    buckets=[1.0, 5.0, 15.0, 60.0],
+    registry=REGISTRY,
 )
 
 # RAG metrics
 rag_queries_total = Counter(
     "slack_rag_queries_total",
     "Total RAG queries",
-    ["channel_id", "index"],
+    ["channel_tier", "index"],
+    registry=REGISTRY,
 )
 
 rag_query_duration_seconds = Histogram(
     "slack_rag_query_duration_seconds",
     "RAG query duration in seconds",
-    ["channel_id", "index"],
+    ["channel_tier", "index"],
     buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
+    registry=REGISTRY,
 )
 
-rag_documents_retrieved = Histogram(
+# Small integer counts: a sum/count pair per index is enough
+rag_documents_retrieved = Summary(
     "slack_rag_documents_retrieved",
     "Number of documents retrieved",
-    ["channel_id", "index"],
-    buckets=[1, 3, 5, 10, 20],
+    ["index"],
+    registry=REGISTRY,
 )
 
 # Classification metrics
 classification_total = Counter(
     "slack_rag_classification_total",
     "Total classifications",
-    ["channel_id", "question_type"],
+    ["channel_tier", "question_type"],
+    registry=REGISTRY,
 )
 
 classification_duration_seconds = Histogram(
     "slack_rag_classification_duration_seconds",
     "Classification duration in seconds",
     buckets=[0.1, 0.5, 1.0, 2.0, 5.0],
+    registry=REGISTRY,
 )
 
 # Action metrics
 actions_requested_total = Counter(
     "slack_rag_actions_requested_total",
     "Total actions requested",
-    ["channel_id", "action_name"],
+    ["channel_tier", "action_name"],
+    registry=REGISTRY,
 )
 
 actions_approved_total = Counter(
     "slack_rag_actions_approved_total",
     "Total actions approved",
-    ["channel_id", "action_name"],
+    ["channel_tier", "action_name"],
+    registry=REGISTRY,
 )
 
 actions_executed_total = Counter(
     "slack_rag_actions_executed_total",
     "Total actions executed",
-    ["channel_id", "action_name", "status"],
+    ["action_name", "status"],
+    registry=REGISTRY,
 )
 
 action_duration_seconds = Histogram(
     "slack_rag_action_duration_seconds",
     "Action execution duration in seconds",
-    ["channel_id", "action_name"],
-    buckets=[0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0],
+    ["channel_tier", "action_name"],
+    buckets=[1.0, 10.0, 60.0, 300.0],
+    registry=REGISTRY,
 )
 
 # Feedback metrics
 feedback_total = Counter(
     "slack_rag_feedback_total",
     "Total feedback received",
-    ["channel_id", "rating"],
+    ["channel_tier", "rating"],
+    registry=REGISTRY,
 )
 
 helpful_rate = Gauge(
     "slack_rag_helpful_rate",
     "Percentage of helpful responses",
-    ["channel_id"],
+    ["channel_tier"],
+    registry=REGISTRY,
 )
 
 # Jira metrics
 jira_issues_created_total = Counter(
     "slack_rag_jira_issues_created_total",
     "Total Jira issues created",
-    ["channel_id", "issue_type"],
+    ["channel_tier", "issue_type"],
+    registry=REGISTRY,
 )
 
 jira_issues_updated_total = Counter(
     "slack_rag_jira_issues_updated_total",
     "Total Jira issues updated",
-    ["channel_id"],
+    ["channel_tier"],
+    registry=REGISTRY,
 )
 
 # Escalation metrics
 escalations_total = Counter(
     "slack_rag_escalations_total",
     "Total escalations",
-    ["channel_id", "reason"],
+    ["channel_tier", "reason"],
+    registry=REGISTRY,
 )
 
-# Error metrics
+# Error metrics. Error types are a fixed set so exception names or other
+# free-form values can't create new series; anything else is "other".
+_ALLOWED_ERROR_TYPES = frozenset({"slack_api", "rag", "db", "llm", "jira", "queue_full", "other"})
+
 errors_total = Counter(
     "slack_rag_errors_total",
     "Total errors",
     ["component", "error_type"],
+    registry=REGISTRY,
+)
+
+# Background queue depth (metrics and log records waiting to be applied/written)
+queue_depth = Gauge(
+    "slack_rag_queue_depth",
+    "Items waiting in background queues",
+    ["queue"],
+    registry=REGISTRY,
 )
 
-# Active conversations
+# Active conversations. A single series: seeded from the database at startup
+# and incremented as conversations are created.
 active_conversations = Gauge(
     "slack_rag_active_conversations",
     "Number of active conversations",
-    ["channel_id"],
+    registry=REGISTRY,
 )
 
 
+@lru_cache(maxsize=4096)
+def _child(name: str, labels: tuple[tuple[str, str], ...]) -> Any:
+    """Resolve and cache a labeled metric child.
+
+    Args:
+        name: Metric attribute name in this module
+        labels: Label name/value pairs
+
+    Returns:
+        Labeled metric child, or the metric itself when it has no labels
+    """
+    metric = globals()[name]
+    return metric.labels(**dict(labels)) if labels else metric
+
+
+def labeled(name: str, labels: dict[str, str]) -> Any:
+    """Get a labeled metric child, skipping prometheus_client's label lookup when cached.
+
+    The cache is size-capped so an unexpected label value can't grow it
+    without bound.
+
+    Args:
+        name: Metric attribute name in this module, e.g. "feedback_total"
+        labels: Label values
+
+    Returns:
+        Labeled metric child
+    """
+    return _child(name, tuple(labels.items()))
+
+
+def record_error(component: str, error_type: str) -> None:
+    """Count an error, folding unknown error types into "other".
+
+    Args:
+        component: Component that hit the error
+        error_type: Error category, one of ``_ALLOWED_ERROR_TYPES``
+    """
+    if error_type not in _ALLOWED_ERROR_TYPES:
+        error_type = "other"
+    labeled("errors_total", {"component": component, "error_type": error_type}).inc()
+
+
 def setup_metrics(settings: Settings) -> None:
     """Start Prometheus metrics server.
 
     Args:
         settings: Application settings
     """
-    start_http_server(settings.metrics_port)
+    start_http_server(settings.metrics_port, registry=REGISTRY)
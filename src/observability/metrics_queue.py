@@ -0,0 +1,124 @@
+"""Background application of Prometheus metric updates.
+
+Handlers enqueue updates with ``record_metric`` and a single drain task applies
+them in batches, so label lookups and metric locks stay off the request path.
+"""
+
+import asyncio
+
+import structlog
+from prometheus_client import Gauge, Histogram, Summary
+
+from src.observability import metrics
+from src.observability.logging import log_queue_depth
+
+logger = structlog.get_logger(__name__)
+
+MAX_BATCH_SIZE = 256
+BATCH_WINDOW_SECONDS = 0.1
+MAX_QUEUE_SIZE = 20_000
+
+# (metric attribute name in src.observability.metrics, labels, value)
+metric_queue: asyncio.Queue[tuple[str, dict[str, str], float | None]] = asyncio.Queue(
+    maxsize=MAX_QUEUE_SIZE
+)
+
+_drain_task: asyncio.Task | None = None
+
+
+def record_metric(name: str, labels: dict[str, str], value: float | None = None) -> None:
+    """Queue a metric update.
+
+    Counters are incremented by ``value`` (or 1 when omitted), histograms and
+    summaries observe ``value`` and gauges are set to it. Updates are dropped
+    and counted in ``errors_total`` when the queue is full.
+
+    Args:
+        name: Metric attribute name in ``src.observability.metrics``
+        labels: Metric label values
+        value: Update value
+    """
+    try:
+        metric_queue.put_nowait((name, labels, value))
+    except asyncio.QueueFull:
+        # Not logged: a warning per drop would flood the log queue as well
+        metrics.record_error("metrics_queue", "queue_full")
+
+
+def _apply(name: str, labels: dict[str, str], value: float | None) -> None:
+    """Apply a single metric update.
+
+    Args:
+        name: Metric attribute name
+        labels: Metric label values
+        value: Update value
+    """
+    child = metrics.labeled(name, labels)
+
+    if value is None:
+        child.inc()
+    elif isinstance(child, (Histogram, Summary)):
+        child.observe(value)
+    elif isinstance(child, Gauge):
+        child.set(value)
+    else:
+        child.inc(value)
+
+
+async def metrics_drain() -> None:
+    """Apply queued metric updates in batches until cancelled."""
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await metric_queue.get()]
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+
+        try:
+            while len(batch) < MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(metric_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            # Apply what was dequeued even if the task is being cancelled
+            for name, labels, value in batch:
+                try:
+                    _apply(name, labels, value)
+                except Exception as e:
+                    logger.exception("Failed to apply metric update", metric=name, error=str(e))
+
+            metrics.queue_depth.labels(queue="metrics").set(metric_queue.qsize())
+            metrics.queue_depth.labels(queue="logs").set(log_queue_depth())
+
+
+def start_metrics_drain() -> asyncio.Task:
+    """Start the metrics drain task if it isn't already running.
+
+    Returns:
+        Drain task
+    """
+    global _drain_task
+
+    if _drain_task is None or _drain_task.done():
+        _drain_task = asyncio.create_task(metrics_drain())
+
+    return _drain_task
+
+
+async def stop_metrics_drain() -> None:
+    """Stop the drain task and apply any updates still queued."""
+    global _drain_task
+
+    if _drain_task is not None:
+        _drain_task.cancel()
+        try:
+            await _drain_task
+        except asyncio.CancelledError:
+            pass
+        _drain_task = None
+
+    while not metric_queue.empty():
+        _apply(*metric_queue.get_nowait())
@@ -1,13 +1,15 @@
 """Slack bot initialization and event handlers."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import structlog
-from slack_bolt.async_app import AsyncApp
 
-from src.config.channel_config import ChannelConfigManager
-from src.config.settings import Settings
-from src.slack.handlers.message import register_message_handlers
-from src.slack.handlers.reaction import register_reaction_handlers
-from src.slack.handlers.action import register_action_handlers
+if TYPE_CHECKING:
+    from slack_bolt.async_app import AsyncApp
+
+    from src.config.settings import Settings
 
 logger = structlog.get_logger(__name__)
 
@@ -21,6 +23,17 @@ async def create_slack_app(settings: Settings) -> AsyncApp:
     Returns:
         Configured Slack app
     """
+    # Imported here so importing this module doesn't load the Slack SDK,
+    # handlers and services until an app is actually built
+    from slack_bolt.async_app import AsyncApp
+
+    from src.config.channel_config import ChannelConfigManager
+    from src.observability.metrics_queue import start_metrics_drain
+    from src.slack.handlers.action import register_action_handlers
+    from src.slack.handlers.message import register_message_handlers
+    from src.slack.handlers.reaction import register_reaction_handlers
+    from src.slack.services.message_queue import start_message_workers
+
     app = AsyncApp(
         token=settings.slack_bot_token.get_secret_value(),
         signing_secret=settings.slack_signing_secret.get_secret_value(),
@@ -32,6 +45,12 @@ async def create_slack_app(settings: Settings) -> AsyncApp:
     # Attach to app context
     app.client.channel_manager = channel_manager  # type: ignore
 
+    # Apply handler metric updates in the background
+    start_metrics_drain()
+
+    # Run message responses off the event listeners
+    start_message_workers(settings.message_worker_count, settings.message_queue_size)
+
     # Register event handlers
     register_message_handlers(app, settings, channel_manager)
     register_reaction_handlers(app, settings, channel_manager)
@@ -41,10 +60,10 @@ async def create_slack_app(settings: Settings) -> AsyncApp:
     @app.event("app_mention")
     async def handle_app_mention(event: dict, say: callable) -> None:
         """Handle app mentions."""
-        user = event.get("user")
-        text = event.get("text", "")
+        text = event.get("text", "").lower()
 
-        if "health" in text.lower() or "ping" in text.lower():
+        if "health" in text or "ping" in text:
+            user = event.get("user")
             await say(
                 text=f"<@{user}> I'm healthy and ready to help!",
                 thread_ts=event.get("ts"),
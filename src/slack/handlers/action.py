@@ -5,6 +5,7 @@ from typing import Any
 import structlog
 from slack_bolt.async_app import AsyncApp
 from slack_sdk.errors import SlackApiError
+from structlog.contextvars import bound_contextvars
 
 from src.config.channel_config import ChannelConfigManager
 from src.config.settings import Settings
@@ -12,6 +13,39 @@ from src.slack.services.action_service import ActionService
 
 logger = structlog.get_logger(__name__)
 
+# Static modal for summary edits; shared across clicks, so never mutate it
+_EDIT_SUMMARY_VIEW: dict[str, Any] = {
+    "type": "modal",
+    "callback_id": "edit_summary_modal",
+    "title": {"type": "plain_text", "text": "Edit Summary"},
+    "submit": {"type": "plain_text", "text": "Submit"},
+    "blocks": [
+        {
+            "type": "input",
+            "block_id": "summary_input",
+            "element": {
+                "type": "plain_text_input",
+                "action_id": "summary_text",
+                "multiline": True,
+            },
+            "label": {"type": "plain_text", "text": "Summary"},
+        }
+    ],
+}
+
+
+def _event_payload(body: dict[str, Any]) -> dict[str, Any]:
+    """Get the message metadata event payload from an action body.
+
+    Args:
+        body: Action payload
+
+    Returns:
+        Event payload, or an empty dict when the message has no metadata
+    """
+    metadata = (body.get("message") or {}).get("metadata") or {}
+    return metadata.get("event_payload") or {}
+
 
 def register_action_handlers(
     app: AsyncApp,
@@ -42,30 +76,32 @@ def register_action_handlers(
         channel_id = body["channel"]["id"]
         message_ts = body["message"]["ts"]
 
-        logger.info(
-            "Summary approved",
-            user_id=user_id,
-            channel_id=channel_id,
-            message_ts=message_ts,
-        )
-
-        # Extract conversation metadata
-        metadata = body.get("message", {}).get("metadata", {})
-        thread_ts = metadata.get("event_payload", {}).get("thread_ts")
-
-        if not thread_ts:
-            logger.error("Missing thread_ts in metadata")
-            return
-
-        try:
-            await action_service.handle_summary_approval(
-                user_id=user_id,
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                client=client,
-            )
-        except Exception as e:
-            logger.exception("Error handling summary approval", error=str(e))
+        with bound_contextvars(user_id=user_id, channel_id=channel_id, message_ts=message_ts):
+            logger.info("Summary approved")
+
+            # Extract conversation metadata
+            payload = _event_payload(body)
+            thread_ts = payload.get("thread_ts")
+
+            if not thread_ts:
+                logger.error("Missing thread_ts in metadata")
+                return
+
+            try:
+                await action_service.handle_summary_approval(
+                    user_id=user_id,
+                    channel_id=channel_id,
+                    thread_ts=thread_ts,
+                    client=client,
+                )
+            except SlackApiError as e:
+                logger.warning(
+                    "Slack API error handling summary approval",
+                    status=e.response.status_code,
+                    error=str(e),
+                )
+            except Exception as e:
+                logger.exception("Error handling summary approval", error=str(e))
 
     @app.action("edit_summary")
     async def handle_edit_summary(ack: callable, body: dict[str, Any], client: Any) -> None:
@@ -84,27 +120,14 @@ def register_action_handlers(
         try:
             await client.views_open(
                 trigger_id=trigger_id,
-                view={
-                    "type": "modal",
-                    "callback_id": "edit_summary_modal",
-                    "title": {"type": "plain_text", "text": "Edit Summary"},
-                    "submit": {"type": "plain_text", "text": "Submit"},
-                    "blocks": [
-                        {
-                            "type": "input",
-                            "block_id": "summary_input",
-                            "element": {
-                                "type": "plain_text_input",
-                                "action_id": "summary_text",
-                                "multiline": True,
-                            },
-                            "label": {"type": "plain_text", "text": "Summary"},
-                        }
-                    ],
-                },
+                view=_EDIT_SUMMARY_VIEW,
             )
         except SlackApiError as e:
-            logger.exception("Error opening edit modal", error=str(e))
+            logger.warning(
+                "Error opening edit modal",
+                status=e.response.status_code,
+                error=str(e),
+            )
 
     @app.action("cancel_summary")
     async def handle_cancel_summary(ack: callable, body: dict[str, Any]) -> None:
@@ -136,27 +159,29 @@ def register_action_handlers(
         channel_id = body["channel"]["id"]
 
         # Extract action metadata
-        metadata = body.get("message", {}).get("metadata", {})
-        action_id = metadata.get("event_payload", {}).get("action_id")
-        thread_ts = metadata.get("event_payload", {}).get("thread_ts")
-
-        logger.info(
-            "Action approved",
-            user_id=user_id,
-            channel_id=channel_id,
-            action_id=action_id,
-        )
-
-        try:
-            await action_service.handle_action_approval(
-                action_id=action_id,
-                user_id=user_id,
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                client=client,
-            )
-        except Exception as e:
-            logger.exception("Error handling action approval", error=str(e))
+        payload = _event_payload(body)
+        action_id = payload.get("action_id")
+        thread_ts = payload.get("thread_ts")
+
+        with bound_contextvars(user_id=user_id, channel_id=channel_id, action_id=action_id):
+            logger.info("Action approved")
+
+            try:
+                await action_service.handle_action_approval(
+                    action_id=action_id,
+                    user_id=user_id,
+                    channel_id=channel_id,
+                    thread_ts=thread_ts,
+                    client=client,
+                )
+            except SlackApiError as e:
+                logger.warning(
+                    "Slack API error handling action approval",
+                    status=e.response.status_code,
+                    error=str(e),
+                )
+            except Exception as e:
+                logger.exception("Error handling action approval", error=str(e))
 
     @app.action("reject_action")
     async def handle_reject_action(ack: callable, body: dict[str, Any]) -> None:
@@ -1,24 +1,62 @@
 """Message event handlers."""
 
 import time
+from functools import partial
 from typing import Any
 
 import structlog
 from slack_bolt.async_app import AsyncApp
 from slack_sdk.errors import SlackApiError
+from structlog.contextvars import bound_contextvars
 
 from src.config.channel_config import ChannelConfigManager
 from src.config.settings import Settings
-from src.observability.metrics import (
-    first_response_time_seconds,
-    messages_processed_total,
-    messages_received_total,
-)
+from src.models.conversation import Conversation
+from src.observability.metrics_queue import record_metric
 from src.slack.services.conversation_service import ConversationService
 from src.slack.services.message_processor import MessageProcessor
+from src.slack.services.message_queue import enqueue_message
 
 logger = structlog.get_logger(__name__)
 
+# Message subtypes that never need a response
+_SKIP_SUBTYPES = frozenset({"bot_message", "message_changed", "message_deleted"})
+
+
+async def _report_failure(
+    error: Exception, channel_tier: str, thread_ts: str, say: callable
+) -> None:
+    """Log a message processing failure and tell the user.
+
+    Args:
+        error: Exception raised while handling the message
+        channel_tier: Channel tier metric label
+        thread_ts: Thread to reply in
+        say: Function to send messages
+    """
+    if isinstance(error, SlackApiError):
+        # Rate limits and transient API errors are expected; skip the traceback
+        logger.warning(
+            "Slack API error processing message",
+            status=error.response.status_code,
+            error=str(error),
+        )
+    else:
+        logger.exception("Error processing message", error=str(error))
+    record_metric(
+        "messages_processed_total",
+        {"channel_tier": channel_tier, "status": "error"},
+    )
+
+    # Send error message to user
+    try:
+        await say(
+            text="Sorry, I encountered an error processing your message. Please try again.",
+            thread_ts=thread_ts,
+        )
+    except Exception as send_error:
+        logger.exception("Failed to send error message", error=str(send_error))
+
 
 def register_message_handlers(
     app: AsyncApp,
@@ -35,6 +73,58 @@ def register_message_handlers(
     conversation_service = ConversationService()
     message_processor = MessageProcessor(settings, channel_manager)
 
+    async def respond(
+        conversation: Conversation,
+        event: dict[str, Any],
+        channel_tier: str,
+        thread_ts: str,
+        client: Any,
+        say: callable,
+    ) -> None:
+        """Run the message pipeline and post the response.
+
+        Runs on a message worker after the handler has queued it.
+
+        Args:
+            conversation: Conversation instance
+            event: Slack event data
+            channel_tier: Channel tier metric label
+            thread_ts: Thread timestamp
+            client: Slack client
+            say: Function to send messages
+        """
+        channel_id = event.get("channel")
+
+        with bound_contextvars(
+            channel_id=channel_id, thread_ts=thread_ts, user_id=event.get("user")
+        ):
+            try:
+                start_time = time.perf_counter()
+                await message_processor.process_message(
+                    conversation=conversation,
+                    message_text=event.get("text", ""),
+                    files=event.get("files", []),
+                    channel_id=channel_id,
+                    thread_ts=thread_ts,
+                    client=client,
+                    say=say,
+                )
+                duration = time.perf_counter() - start_time
+
+                # Record metrics
+                record_metric(
+                    "first_response_time_seconds", {"channel_tier": channel_tier}, duration
+                )
+                record_metric(
+                    "messages_processed_total",
+                    {"channel_tier": channel_tier, "status": "success"},
+                )
+
+                logger.info("Message processed successfully", duration_seconds=duration)
+
+            except Exception as e:
+                await _report_failure(e, channel_tier, thread_ts, say)
+
     @app.event("message")
     async def handle_message(event: dict[str, Any], client: Any, say: callable) -> None:
         """Handle incoming messages.
@@ -44,10 +134,8 @@ def register_message_handlers(
             client: Slack client
             say: Function to send messages
         """
-        start_time = time.time()
-
         # Skip bot messages and message changes
-        if event.get("subtype") in ["bot_message", "message_changed", "message_deleted"]:
+        if event.get("subtype") in _SKIP_SUBTYPES:
             return
 
         channel_id = event.get("channel")
@@ -56,95 +144,54 @@ def register_message_handlers(
         ts = event.get("ts")
         thread_ts = event.get("thread_ts", ts)  # Use message ts if not in a thread
 
-        logger.info(
-            "Message received",
-            channel_id=channel_id,
-            user_id=user_id,
-            thread_ts=thread_ts,
-            has_files=bool(event.get("files")),
-        )
+        with bound_contextvars(channel_id=channel_id, thread_ts=thread_ts, user_id=user_id):
+            logger.info("Message received", has_files=bool(event.get("files")))
 
-        # Record metric
-        messages_received_total.labels(
-            channel_id=channel_id,
-            message_type="user_message",
-        ).inc()
-
-        # Check if channel is configured
-        if not channel_manager.is_channel_enabled(channel_id):
-            logger.debug("Channel not enabled", channel_id=channel_id)
-            return
+            channel_tier = channel_manager.get_tier(channel_id)
 
-        try:
-            # Check if this is a new conversation or continuation
-            conversation = await conversation_service.get_or_create_conversation(
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                user_id=user_id,
+            # Record metric
+            record_metric(
+                "messages_received_total",
+                {"channel_tier": channel_tier, "message_type": "user_message"},
             )
 
-            # Save the message
-            await conversation_service.save_message(
-                conversation_id=conversation.id,
-                ts=ts,
-                user_id=user_id,
-                text=text,
-                files=event.get("files", []),
-            )
+            # Check if channel is configured
+            if not channel_manager.is_channel_enabled(channel_id):
+                logger.debug("Channel not enabled")
+                return
 
-            # Send acknowledgment (reaction or quick reply)
             try:
-                await client.reactions_add(
-                    channel=channel_id,
-                    timestamp=ts,
-                    name="eyes",  # 👀 emoji to show we're processing
+                # Check if this is a new conversation or continuation
+                conversation = await conversation_service.get_or_create_conversation(
+                    channel_id=channel_id,
+                    thread_ts=thread_ts,
+                    user_id=user_id,
                 )
-            except SlackApiError as e:
-                logger.warning("Failed to add reaction", error=str(e))
-
-            # Process the message
-            await message_processor.process_message(
-                conversation=conversation,
-                message_text=text,
-                files=event.get("files", []),
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                client=client,
-                say=say,
-            )
-
-            # Record metrics
-            duration = time.time() - start_time
-            first_response_time_seconds.labels(channel_id=channel_id).observe(duration)
-            messages_processed_total.labels(
-                channel_id=channel_id,
-                status="success",
-            ).inc()
-
-            logger.info(
-                "Message processed successfully",
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                duration_seconds=duration,
-            )
 
-        except Exception as e:
-            logger.exception(
-                "Error processing message",
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                error=str(e),
-            )
-            messages_processed_total.labels(
-                channel_id=channel_id,
-                status="error",
-            ).inc()
+                # Save the message
+                await conversation_service.save_message(
+                    conversation_id=conversation.id,
+                    ts=ts,
+                    user_id=user_id,
+                    text=text,
+                    files=event.get("files", []),
+                )
 
-            # Send error message to user
-            try:
-                await say(
-                    text="Sorry, I encountered an error processing your message. Please try again.",
-                    thread_ts=thread_ts,
+                # Send acknowledgment (reaction or quick reply)
+                try:
+                    await client.reactions_add(
+                        channel=channel_id,
+                        timestamp=ts,
+                        name="eyes",  # 👀 emoji to show we're processing
+                    )
+                except SlackApiError as e:
+                    logger.warning("Failed to add reaction", error=str(e))
+
+                # Process the message in the background; waits only if the queue is full
+                await enqueue_message(
+                    channel_id,
+                    partial(respond, conversation, event, channel_tier, thread_ts, client, say),
                 )
-            except Exception as send_error:
-                logger.exception("Failed to send error message", error=str(send_error))
+
+            except Exception as e:
+                await _report_failure(e, channel_tier, thread_ts, say)
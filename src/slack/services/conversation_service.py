@@ -1,23 +1,86 @@
 """Service for managing conversations and messages."""
 
-import json
+import asyncio
+from collections.abc import Collection
 from datetime import datetime, timedelta
 from typing import Any
+from weakref import WeakValueDictionary
 
 import structlog
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import selectinload
 
+from src.models.action import ActionRun  # noqa: F401 - resolves Conversation.actions at import
 from src.models.base import AsyncSessionLocal
 from src.models.conversation import Conversation, ConversationStatus, Message, QuestionType
 from src.models.feedback import Feedback, FeedbackRating
+from src.observability.metrics_queue import record_metric
 
 logger = structlog.get_logger(__name__)
 
+# Thread and message timestamps map to a fixed conversation id once created
+ID_CACHE_MAX_ENTRIES = 10_000
+ID_CACHE_TTL_SECONDS = 300
+
+# Statements run on every Slack event are built once; values are bound per call
+_SELECT_CONVERSATION_BY_THREAD = select(Conversation).where(
+    Conversation.thread_ts == bindparam("thread_ts")
+)
+_SELECT_CONVERSATION_WITH_MESSAGES_BY_THREAD = _SELECT_CONVERSATION_BY_THREAD.options(
+    selectinload(Conversation.messages)
+)
+_SELECT_MESSAGE_BY_TS = select(Message).where(Message.ts == bindparam("ts"))
+_SELECT_CONVERSATIONS_BY_MESSAGE_TS = (
+    select(Message.ts, Conversation)
+    .join(Conversation, Message.conversation_id == Conversation.id)
+    .where(Message.ts.in_(bindparam("message_tss", expanding=True)))
+)
+# Duplicate Slack deliveries are ignored by the unique ts index instead of a pre-check
+_INSERT_MESSAGE_BY_DIALECT = {
+    dialect.dialect.name: dialect.insert(Message)
+    .on_conflict_do_nothing(index_elements=[Message.ts])
+    .returning(Message)
+    for dialect in (postgresql, sqlite)
+}
+_INSERT_FEEDBACK = insert(Feedback).returning(Feedback)
+_UPDATE_QUESTION_TYPE = (
+    update(Conversation)
+    .where(Conversation.id == bindparam("conversation_id"))
+    .values(question_type=bindparam("new_question_type"))
+)
+_UPDATE_SUMMARY = (
+    update(Conversation)
+    .where(Conversation.id == bindparam("conversation_id"))
+    .values(summary=bindparam("new_summary"), summary_confirmed=bindparam("confirmed"))
+)
+_MARK_FIRST_RESPONSE = (
+    update(Conversation)
+    .where(
+        Conversation.id == bindparam("conversation_id"),
+        Conversation.first_response_at.is_(None),
+    )
+    .values(first_response_at=bindparam("now"))
+)
+
 
 class ConversationService:
     """Service for conversation and message operations."""
 
+    LOOKUP_BATCH_WINDOW_SECONDS = 0.02
+    MAX_LOOKUP_BATCH_SIZE = 100
+
+    def __init__(self) -> None:
+        """Initialize the service with empty conversation id caches."""
+        self._thread_ids: TTLCache[str, int] = TTLCache(ID_CACHE_MAX_ENTRIES, ID_CACHE_TTL_SECONDS)
+        self._message_ids: TTLCache[str, int] = TTLCache(ID_CACHE_MAX_ENTRIES, ID_CACHE_TTL_SECONDS)
+        self._thread_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+        self._pending_lookups: dict[str, list[asyncio.Future[Conversation | None]]] = {}
+        self._lookup_flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
     async def get_or_create_conversation(
         self,
         channel_id: str,
@@ -25,6 +88,7 @@ class ConversationService:
         user_id: str,
         sla_minutes: int = 120,
         first_response_minutes: int = 15,
+        load_messages: bool = False,
     ) -> Conversation:
         """Get existing conversation or create a new one.
 
@@ -34,20 +98,68 @@ class ConversationService:
             user_id: User ID
             sla_minutes: SLA deadline in minutes
             first_response_minutes: First response deadline in minutes
+            load_messages: Whether to eagerly load an existing conversation's messages
 
         Returns:
             Conversation instance
         """
-        async with AsyncSessionLocal() as session:
+        # Serialize events for the same thread so they can't both create it
+        lock = self._thread_locks.get(thread_ts)
+        if lock is None:
+            lock = self._thread_locks[thread_ts] = asyncio.Lock()
+
+        async with lock:
+            return await self._get_or_create_conversation(
+                channel_id,
+                thread_ts,
+                user_id,
+                sla_minutes,
+                first_response_minutes,
+                load_messages,
+            )
+
+    async def _get_or_create_conversation(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        user_id: str,
+        sla_minutes: int,
+        first_response_minutes: int,
+        load_messages: bool,
+    ) -> Conversation:
+        """Get or create a conversation while holding the thread's lock.
+
+        Args:
+            channel_id: Slack channel ID
+            thread_ts: Thread timestamp
+            user_id: User ID
+            sla_minutes: SLA deadline in minutes
+            first_response_minutes: First response deadline in minutes
+            load_messages: Whether to eagerly load an existing conversation's messages
+
+        Returns:
+            Conversation instance
+        """
+        options = [selectinload(Conversation.messages)] if load_messages else []
+
+        async with AsyncSessionLocal() as session, session.begin():
+            # Known threads are fetched by primary key
+            conversation_id = self._thread_ids.get(thread_ts)
+            if conversation_id is not None:
+                conversation = await session.get(Conversation, conversation_id, options=options)
+                if conversation:
+                    return conversation
+
             # Try to find existing conversation
-            result = await session.execute(
-                select(Conversation)
-                .where(Conversation.thread_ts == thread_ts)
-                .options(selectinload(Conversation.messages))
+            stmt = (
+                _SELECT_CONVERSATION_WITH_MESSAGES_BY_THREAD
+                if load_messages
+                else _SELECT_CONVERSATION_BY_THREAD
             )
-            conversation = result.scalar_one_or_none()
+            conversation = await session.scalar(stmt, {"thread_ts": thread_ts})
 
             if conversation:
+                self._thread_ids[thread_ts] = conversation.id
                 return conversation
 
             # Create new conversation
@@ -61,17 +173,21 @@ class ConversationService:
                 first_response_deadline=now + timedelta(minutes=first_response_minutes),
             )
 
+            # Flush assigns the id and fetches server defaults via RETURNING,
+            # so no refresh query is needed; the transaction commits on exit
             session.add(conversation)
-            await session.commit()
-            await session.refresh(conversation)
+            await session.flush()
 
-            logger.info(
-                "Conversation created",
-                conversation_id=conversation.id,
-                thread_ts=thread_ts,
-            )
+        self._thread_ids[thread_ts] = conversation.id
+        record_metric("active_conversations", {})
+
+        logger.info(
+            "Conversation created",
+            conversation_id=conversation.id,
+            thread_ts=thread_ts,
+        )
 
-            return conversation
+        return conversation
 
     async def save_message(
         self,
@@ -97,43 +213,46 @@ class ConversationService:
         Returns:
             Message instance
         """
-        async with AsyncSessionLocal() as session:
-            # Check if message already exists
+        # Prepare file data
+        has_files = bool(files)
+        file_urls = [f.get("url_private") for f in files] if files else None
+
+        async with AsyncSessionLocal() as session, session.begin():
+            insert_message = _INSERT_MESSAGE_BY_DIALECT[session.get_bind().dialect.name]
             result = await session.execute(
-                select(Message).where(Message.ts == ts)
+                insert_message,
+                [
+                    {
+                        "conversation_id": conversation_id,
+                        "ts": ts,
+                        "user_id": user_id,
+                        "text": text,
+                        "has_files": has_files,
+                        "file_urls": file_urls,
+                        "is_bot_response": is_bot_response,
+                        "ocr_text": ocr_text,
+                    }
+                ],
             )
-            existing_message = result.scalar_one_or_none()
-
-            if existing_message:
-                return existing_message
+            message = result.scalar_one_or_none()
 
-            # Prepare file data
-            has_files = bool(files)
-            file_urls = json.dumps([f.get("url_private") for f in files]) if files else None
+            if message is None:
+                # Already stored by an earlier delivery of the same event
+                result = await session.execute(_SELECT_MESSAGE_BY_TS, {"ts": ts})
+                message = result.scalar_one()
+                self._message_ids[ts] = message.conversation_id
+                return message
 
-            message = Message(
-                conversation_id=conversation_id,
-                ts=ts,
-                user_id=user_id,
-                text=text,
-                has_files=has_files,
-                file_urls=file_urls,
-                is_bot_response=is_bot_response,
-                ocr_text=ocr_text,
-            )
+        self._message_ids[ts] = conversation_id
 
-            session.add(message)
-            await session.commit()
-            await session.refresh(message)
-
-            logger.debug(
-                "Message saved",
-                message_id=message.id,
-                conversation_id=conversation_id,
-                has_files=has_files,
-            )
+        logger.debug(
+            "Message saved",
+            message_id=message.id,
+            conversation_id=conversation_id,
+            has_files=has_files,
+        )
 
-            return message
+        return message
 
     async def update_conversation_type(
         self,
@@ -146,21 +265,18 @@ class ConversationService:
             conversation_id: Conversation ID
             question_type: Question type
         """
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal() as session, session.begin():
             result = await session.execute(
-                select(Conversation).where(Conversation.id == conversation_id)
+                _UPDATE_QUESTION_TYPE,
+                {"conversation_id": conversation_id, "new_question_type": question_type},
             )
-            conversation = result.scalar_one_or_none()
-
-            if conversation:
-                conversation.question_type = question_type
-                await session.commit()
 
-                logger.info(
-                    "Conversation type updated",
-                    conversation_id=conversation_id,
-                    question_type=question_type.value,
-                )
+        if result.rowcount:
+            logger.info(
+                "Conversation type updated",
+                conversation_id=conversation_id,
+                question_type=question_type.value,
+            )
 
     async def update_conversation_summary(
         self,
@@ -175,22 +291,22 @@ class ConversationService:
             summary: Summary text
             confirmed: Whether summary is confirmed
         """
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal() as session, session.begin():
             result = await session.execute(
-                select(Conversation).where(Conversation.id == conversation_id)
+                _UPDATE_SUMMARY,
+                {
+                    "conversation_id": conversation_id,
+                    "new_summary": summary,
+                    "confirmed": confirmed,
+                },
             )
-            conversation = result.scalar_one_or_none()
-
-            if conversation:
-                conversation.summary = summary
-                conversation.summary_confirmed = confirmed
-                await session.commit()
 
-                logger.info(
-                    "Conversation summary updated",
-                    conversation_id=conversation_id,
-                    confirmed=confirmed,
-                )
+        if result.rowcount:
+            logger.info(
+                "Conversation summary updated",
+                conversation_id=conversation_id,
+                confirmed=confirmed,
+            )
 
     async def mark_first_response(self, conversation_id: int) -> None:
         """Mark first response time for a conversation.
@@ -198,20 +314,18 @@ class ConversationService:
         Args:
             conversation_id: Conversation ID
         """
-        async with AsyncSessionLocal() as session:
+        # Only the first call sets the timestamp; the check happens in the UPDATE
+        async with AsyncSessionLocal() as session, session.begin():
             result = await session.execute(
-                select(Conversation).where(Conversation.id == conversation_id)
+                _MARK_FIRST_RESPONSE,
+                {"conversation_id": conversation_id, "now": datetime.utcnow()},
             )
-            conversation = result.scalar_one_or_none()
-
-            if conversation and not conversation.first_response_at:
-                conversation.first_response_at = datetime.utcnow()
-                await session.commit()
 
-                logger.info(
-                    "First response marked",
-                    conversation_id=conversation_id,
-                )
+        if result.rowcount:
+            logger.info(
+                "First response marked",
+                conversation_id=conversation_id,
+            )
 
     async def find_conversation_by_message(self, message_ts: str) -> Conversation | None:
         """Find conversation by message timestamp.
@@ -222,13 +336,89 @@ class ConversationService:
         Returns:
             Conversation instance or None
         """
+        # Messages saved or looked up recently skip the join
+        conversation_id = self._message_ids.get(message_ts)
+        if conversation_id is not None:
+            async with AsyncSessionLocal() as session:
+                conversation = await session.get(Conversation, conversation_id)
+            if conversation:
+                return conversation
+
+        # Concurrent lookups, e.g. a burst of reactions, share one query
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Conversation | None] = loop.create_future()
+        self._pending_lookups.setdefault(message_ts, []).append(future)
+
+        if len(self._pending_lookups) >= self.MAX_LOOKUP_BATCH_SIZE:
+            self._flush_lookups()
+        elif self._lookup_flush_handle is None:
+            self._lookup_flush_handle = loop.call_later(
+                self.LOOKUP_BATCH_WINDOW_SECONDS, self._flush_lookups
+            )
+
+        return await future
+
+    async def find_conversations_by_message_tss(
+        self, message_tss: Collection[str]
+    ) -> dict[str, Conversation]:
+        """Find the conversations for several message timestamps in one query.
+
+        Args:
+            message_tss: Message timestamps
+
+        Returns:
+            Conversations keyed by message timestamp; unknown timestamps are omitted
+        """
+        if not message_tss:
+            return {}
+
         async with AsyncSessionLocal() as session:
             result = await session.execute(
-                select(Conversation)
-                .join(Message)
-                .where(Message.ts == message_ts)
+                _SELECT_CONVERSATIONS_BY_MESSAGE_TS, {"message_tss": list(message_tss)}
             )
-            return result.scalar_one_or_none()
+            conversations = {ts: conversation for ts, conversation in result.all()}
+
+        for ts, conversation in conversations.items():
+            self._message_ids[ts] = conversation.id
+
+        return conversations
+
+    def _flush_lookups(self) -> None:
+        """Resolve all pending message lookups with a single query."""
+        if self._lookup_flush_handle is not None:
+            self._lookup_flush_handle.cancel()
+            self._lookup_flush_handle = None
+
+        batch, self._pending_lookups = self._pending_lookups, {}
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._resolve_lookups(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve_lookups(
+        self, batch: dict[str, list[asyncio.Future[Conversation | None]]]
+    ) -> None:
+        """Resolve a batch of pending lookup futures.
+
+        Args:
+            batch: Pending futures keyed by message timestamp
+        """
+        try:
+            conversations = await self.find_conversations_by_message_tss(batch.keys())
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for ts, futures in batch.items():
+            conversation = conversations.get(ts)
+            for future in futures:
+                if not future.done():
+                    future.set_result(conversation)
 
     async def save_feedback(
         self,
@@ -250,24 +440,27 @@ class ConversationService:
         Returns:
             Feedback instance
         """
-        async with AsyncSessionLocal() as session:
-            feedback = Feedback(
-                conversation_id=conversation_id,
-                user_id=user_id,
-                rating=rating,
-                message_ts=message_ts,
-                note=note,
+        async with AsyncSessionLocal() as session, session.begin():
+            # RETURNING fills in the generated columns without a refresh query
+            result = await session.execute(
+                _INSERT_FEEDBACK,
+                [
+                    {
+                        "conversation_id": conversation_id,
+                        "user_id": user_id,
+                        "rating": rating,
+                        "message_ts": message_ts,
+                        "note": note,
+                    }
+                ],
             )
+            feedback = result.scalar_one()
 
-            session.add(feedback)
-            await session.commit()
-            await session.refresh(feedback)
-
-            logger.info(
-                "Feedback saved",
-                feedback_id=feedback.id,
-                conversation_id=conversation_id,
-                rating=rating.value,
-            )
+        logger.info(
+            "Feedback saved",
+            feedback_id=feedback.id,
+            conversation_id=conversation_id,
+            rating=rating.value,
+        )
 
-            return feedback
+        return feedback
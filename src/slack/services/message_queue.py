@@ -0,0 +1,192 @@
+"""Background processing of incoming Slack messages.
+
+Message handlers store the message, enqueue the response work with
+``enqueue_message`` and return. A fixed pool of workers runs the jobs, so slow
+LLM and OCR calls don't hold event listeners, and a full queue pushes back on
+the handlers instead of growing without bound. Jobs for a channel start at
+most once per ``CHANNEL_POST_INTERVAL_SECONDS``; jobs that aren't due wait
+outside the workers so other channels keep being served.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+from src.observability.metrics_queue import record_metric
+
+logger = structlog.get_logger(__name__)
+
+# Slack allows roughly one chat.postMessage per second per channel
+CHANNEL_POST_INTERVAL_SECONDS = 1.0
+
+MessageJob = Callable[[], Awaitable[None]]
+
+# (channel ID, job, whether the channel's pacing slot is already reserved)
+_queue: asyncio.Queue[tuple[str, MessageJob, bool]] | None = None
+# Bounds queued and deferred jobs; the queue itself is unbounded so deferred
+# jobs can always be handed back to it
+_slots: asyncio.Semaphore | None = None
+_workers: set[asyncio.Task[None]] = set()
+
+# Earliest time the next job for each channel may start
+_next_start: dict[str, float] = {}
+# Jobs waiting for their channel's next slot, and the timers that release them
+_backlog: dict[str, deque[MessageJob]] = {}
+_release_timers: dict[str, asyncio.TimerHandle] = {}
+
+
+def start_message_workers(worker_count: int, max_queue_size: int) -> None:
+    """Start the message workers if they aren't already running.
+
+    Args:
+        worker_count: Number of concurrent workers
+        max_queue_size: Jobs allowed to wait before enqueueing blocks
+    """
+    global _queue, _slots
+
+    if _workers:
+        return
+
+    _queue = asyncio.Queue()
+    _slots = asyncio.Semaphore(max_queue_size)
+    for _ in range(worker_count):
+        _workers.add(asyncio.create_task(_worker(_queue, _slots)))
+
+
+async def enqueue_message(channel_id: str, job: MessageJob) -> None:
+    """Queue response work for a message, waiting while the queue is full.
+
+    Args:
+        channel_id: Channel the job will post to
+        job: Coroutine function that processes the message
+    """
+    if _queue is None or _slots is None:
+        raise RuntimeError("Message workers are not running")
+
+    await _slots.acquire()
+    _queue.put_nowait((channel_id, job, False))
+    record_metric("queue_depth", {"queue": "messages"}, _queue.qsize())
+
+
+def _reserve_slot(channel_id: str, now: float) -> bool:
+    """Reserve the channel's next slot if it is free now.
+
+    Args:
+        channel_id: Channel the job will post to
+        now: Current event loop time
+
+    Returns:
+        True if the job may start now
+    """
+    # Jobs already waiting for the channel go first
+    if channel_id in _backlog or _next_start.get(channel_id, now) > now:
+        return False
+
+    _next_start[channel_id] = now + CHANNEL_POST_INTERVAL_SECONDS
+    return True
+
+
+def _schedule_release(channel_id: str, queue: asyncio.Queue[tuple[str, MessageJob, bool]]) -> None:
+    """Hand the channel's oldest deferred job back to the queue when its slot opens.
+
+    Args:
+        channel_id: Channel with deferred jobs
+        queue: Job queue
+    """
+    if channel_id in _release_timers:
+        return
+
+    loop = asyncio.get_running_loop()
+    _release_timers[channel_id] = loop.call_at(
+        _next_start[channel_id], _release, channel_id, queue
+    )
+
+
+def _release(channel_id: str, queue: asyncio.Queue[tuple[str, MessageJob, bool]]) -> None:
+    """Requeue the channel's oldest deferred job with its slot reserved.
+
+    Args:
+        channel_id: Channel with deferred jobs
+        queue: Job queue
+    """
+    del _release_timers[channel_id]
+
+    backlog = _backlog[channel_id]
+    job = backlog.popleft()
+    if not backlog:
+        del _backlog[channel_id]
+
+    loop = asyncio.get_running_loop()
+    _next_start[channel_id] = loop.time() + CHANNEL_POST_INTERVAL_SECONDS
+
+    # The put counts as a new unfinished task, so finish the deferred one after
+    # it to keep join() waiting throughout
+    queue.put_nowait((channel_id, job, True))
+    queue.task_done()
+
+    if channel_id in _backlog:
+        _schedule_release(channel_id, queue)
+
+
+async def _worker(
+    queue: asyncio.Queue[tuple[str, MessageJob, bool]],
+    slots: asyncio.Semaphore,
+) -> None:
+    """Run queued jobs until cancelled.
+
+    Jobs whose channel isn't due yet are set aside instead of slept on, so a
+    burst in one channel doesn't hold workers needed by other channels.
+
+    Args:
+        queue: Job queue
+        slots: Queue capacity released as jobs start
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        channel_id, job, reserved = await queue.get()
+
+        if not reserved and not _reserve_slot(channel_id, loop.time()):
+            # Left unfinished in the queue's count until it is released
+            _backlog.setdefault(channel_id, deque()).append(job)
+            _schedule_release(channel_id, queue)
+            continue
+
+        slots.release()
+        try:
+            await job()
+        except Exception as e:
+            logger.exception("Message job failed", channel_id=channel_id, error=str(e))
+        finally:
+            queue.task_done()
+
+
+async def stop_message_workers(timeout: float) -> None:
+    """Let queued jobs finish, then stop the workers.
+
+    Args:
+        timeout: Seconds to wait for queued jobs before cancelling them
+    """
+    global _queue, _slots
+
+    if _queue is not None:
+        try:
+            await asyncio.wait_for(_queue.join(), timeout)
+        except asyncio.TimeoutError:
+            pending = _queue.qsize() + sum(len(jobs) for jobs in _backlog.values())
+            logger.warning("Message queue not drained before shutdown", pending=pending)
+
+    for timer in _release_timers.values():
+        timer.cancel()
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+
+    _workers.clear()
+    _release_timers.clear()
+    _backlog.clear()
+    _next_start.clear()
+    _queue = None
+    _slots = None
@@ -1,23 +1,27 @@
 """FastAPI web application for monitoring and logs."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any
+import contextlib
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Annotated, Any
 
+import orjson
 import structlog
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from prometheus_client import REGISTRY, generate_latest
-from sqlalchemy import func, select
+from prometheus_client import generate_latest
+from sqlalchemy import bindparam, func, lambda_stmt, select
 
 from src.config.settings import get_settings
 from src.models.audit import AuditEvent
-from src.models.base import AsyncSessionLocal
+from src.models.base import ReadSessionLocal
 from src.models.conversation import Conversation, ConversationStatus, QuestionType
 from src.models.feedback import Feedback, FeedbackRating
 from src.observability.metrics import (
+    REGISTRY,
     errors_total,
     feedback_total,
     messages_processed_total,
@@ -26,11 +30,71 @@ from src.observability.metrics import (
 
 logger = structlog.get_logger(__name__)
 
+# Clients that can't take a broadcast within this window are disconnected
+BROADCAST_SEND_TIMEOUT_SECONDS = 0.5
+
+# Dashboard queries are built once; per-request values are bound at execution
+_STATS_TOTALS = select(
+    func.count(Conversation.id),
+    func.count().filter(Conversation.status == ConversationStatus.ACTIVE),
+    select(func.count(Feedback.id)).scalar_subquery(),
+    select(func.count(Feedback.id))
+    .where(Feedback.rating == FeedbackRating.HELPFUL)
+    .scalar_subquery(),
+)
+_TYPE_DISTRIBUTION = (
+    select(Conversation.question_type, func.count(Conversation.id))
+    .where(Conversation.question_type.isnot(None))
+    .group_by(Conversation.question_type)
+)
+# Listings select only the columns they return, so rows skip ORM identity
+# tracking and the audit payload is never loaded or parsed
+_RECENT_CONVERSATIONS = (
+    select(
+        Conversation.id,
+        Conversation.channel_id,
+        Conversation.thread_ts,
+        Conversation.user_id,
+        Conversation.question_type,
+        Conversation.status,
+        Conversation.created_at,
+        Conversation.jira_key,
+    )
+    .order_by(Conversation.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_AUDIT_EVENT_COLUMNS = (
+    AuditEvent.id,
+    AuditEvent.event_type,
+    AuditEvent.actor_id,
+    AuditEvent.channel_id,
+    AuditEvent.thread_ts,
+    AuditEvent.result,
+    AuditEvent.created_at,
+)
+
+# Upper bound on rows a single listing request can pull
+MAX_LISTING_LIMIT = 500
+_CHANNEL_STATS = select(
+    Conversation.channel_id,
+    func.count().label("total"),
+    func.count().filter(Conversation.status == ConversationStatus.ACTIVE).label("active"),
+).group_by(Conversation.channel_id)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Slack RAG Assistant - Monitoring Dashboard",
     description="Real-time monitoring, metrics, and logs",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Templates
@@ -53,23 +117,91 @@ class ConnectionManager:
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Disconnect a WebSocket client."""
+        # A client dropped by broadcast disconnects again when its socket closes
+        if websocket not in self.active_connections:
+            return
         self.active_connections.remove(websocket)
         logger.info(
             "WebSocket client disconnected", total_connections=len(self.active_connections)
         )
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast message to all connected clients."""
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning("Failed to send message to client", error=str(e))
+        """Broadcast message to all connected clients.
+
+        The message is serialized once and sent to every client concurrently.
+        Clients that fail or are too slow to receive it are disconnected and
+        their sockets closed, since a timed out send may have left a partial
+        frame behind.
+        """
+        payload = orjson.dumps(message).decode()
+        connections = list(self.active_connections)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_text(payload), BROADCAST_SEND_TIMEOUT_SECONDS)
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
+
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning("Dropping WebSocket client after failed send", error=repr(result))
+                self.disconnect(connection)
+                with contextlib.suppress(Exception):
+                    await connection.close()
 
 
 manager = ConnectionManager()
 
 
+class ResultCache:
+    """Cache an async result for a short time, sharing one computation between callers."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._value: Any = None
+        self._expires = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Get the cached value, computing it if it has expired.
+
+        Args:
+            compute: Coroutine function producing a fresh value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        loop = asyncio.get_running_loop()
+        if self._expires > loop.time():
+            return self._value
+
+        async with self._lock:
+            # Another caller may have refreshed it while we waited
+            if self._expires > loop.time():
+                return self._value
+
+            self._value = await compute()
+            self._expires = loop.time() + self.ttl_seconds
+            return self._value
+
+    def clear(self) -> None:
+        """Drop the cached value."""
+        self._value = None
+        self._expires = 0.0
+
+
+# Every dashboard and metrics websocket polls these; one query serves them all
+STATS_CACHE_TTL_SECONDS = 5.0
+_stats_cache = ResultCache(STATS_CACHE_TTL_SECONDS)
+_channel_stats_cache = ResultCache(STATS_CACHE_TTL_SECONDS)
+
+# Walking the registry touches every labelled child, so share a snapshot briefly
+METRICS_SUMMARY_TTL_SECONDS = 1.0
+_metrics_summary_cache = ResultCache(METRICS_SUMMARY_TTL_SECONDS)
+
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request) -> HTMLResponse:
@@ -103,45 +235,32 @@ async def health_check() -> dict[str, Any]:
         "status": "healthy",
         "environment": settings.environment,
         "version": settings.app_version,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
 @app.get("/api/stats")
 async def get_stats() -> dict[str, Any]:
     """Get overall statistics."""
-    async with AsyncSessionLocal() as session:
-        # Total conversations
-        total_conversations = await session.execute(select(func.count(Conversation.id)))
-        total_count = total_conversations.scalar_one()
-
-        # Active conversations
-        active_conversations = await session.execute(
-            select(func.count(Conversation.id)).where(
-                Conversation.status == ConversationStatus.ACTIVE
-            )
-        )
-        active_count = active_conversations.scalar_one()
+    return await _stats_cache.get(_compute_stats)
 
-        # Total feedback
-        total_feedback = await session.execute(select(func.count(Feedback.id)))
-        feedback_count = total_feedback.scalar_one()
 
-        # Helpful feedback
-        helpful_feedback = await session.execute(
-            select(func.count(Feedback.id)).where(Feedback.rating == FeedbackRating.HELPFUL)
-        )
-        helpful_count = helpful_feedback.scalar_one()
+async def _compute_stats() -> dict[str, Any]:
+    """Query overall statistics.
+
+    Returns:
+        Statistics payload
+    """
+    async with ReadSessionLocal() as session:
+        # Conversation and feedback totals in one round trip
+        totals = await session.execute(_STATS_TOTALS)
+        total_count, active_count, feedback_count, helpful_count = totals.one()
 
         # Calculate helpful rate
         helpful_rate = (helpful_count / feedback_count * 100) if feedback_count > 0 else 0
 
         # Conversations by type
-        type_distribution = await session.execute(
-            select(Conversation.question_type, func.count(Conversation.id))
-            .where(Conversation.question_type.isnot(None))
-            .group_by(Conversation.question_type)
-        )
+        type_distribution = await session.execute(_TYPE_DISTRIBUTION)
         type_counts = {
             row[0].value if row[0] else "unknown": row[1] for row in type_distribution.all()
         }
@@ -153,87 +272,93 @@ async def get_stats() -> dict[str, Any]:
             "helpful_count": helpful_count,
             "helpful_rate": round(helpful_rate, 2),
             "type_distribution": type_counts,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
         }
 
 
 @app.get("/api/recent_conversations")
-async def get_recent_conversations(limit: int = 20) -> dict[str, Any]:
+async def get_recent_conversations(
+    limit: Annotated[int, Query(ge=1, le=MAX_LISTING_LIMIT)] = 20,
+) -> dict[str, Any]:
     """Get recent conversations."""
-    async with AsyncSessionLocal() as session:
-        result = await session.execute(
-            select(Conversation)
-            .order_by(Conversation.created_at.desc())
-            .limit(limit)
-        )
-        conversations = result.scalars().all()
+    async with ReadSessionLocal() as session:
+        result = await session.execute(_RECENT_CONVERSATIONS, {"limit": limit})
 
         return {
             "conversations": [
                 {
-                    "id": conv.id,
-                    "channel_id": conv.channel_id,
-                    "thread_ts": conv.thread_ts,
-                    "user_id": conv.user_id,
-                    "question_type": conv.question_type.value if conv.question_type else None,
-                    "status": conv.status.value,
-                    "created_at": conv.created_at.isoformat(),
-                    "jira_key": conv.jira_key,
+                    "id": row.id,
+                    "channel_id": row.channel_id,
+                    "thread_ts": row.thread_ts,
+                    "user_id": row.user_id,
+                    "question_type": row.question_type.value if row.question_type else None,
+                    "status": row.status.value,
+                    "created_at": row.created_at.isoformat(),
+                    "jira_key": row.jira_key,
                 }
-                for conv in conversations
+                for row in result
             ],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
         }
 
 
 @app.get("/api/audit_events")
-async def get_audit_events(limit: int = 50, event_type: str | None = None) -> dict[str, Any]:
+async def get_audit_events(
+    limit: Annotated[int, Query(ge=1, le=MAX_LISTING_LIMIT)] = 50,
+    event_type: str | None = None,
+) -> dict[str, Any]:
     """Get audit events."""
-    async with AsyncSessionLocal() as session:
-        query = select(AuditEvent).order_by(AuditEvent.created_at.desc()).limit(limit)
+    async with ReadSessionLocal() as session:
+        # Lambda statements cache on the code location, so the optional filter
+        # doesn't rebuild and re-key the query on every request
+        query = lambda_stmt(
+            lambda: select(*_AUDIT_EVENT_COLUMNS)
+            .order_by(AuditEvent.created_at.desc())
+            .limit(limit)
+        )
 
         if event_type:
-            query = query.where(AuditEvent.event_type == event_type)
+            query += lambda s: s.where(AuditEvent.event_type == event_type)
 
         result = await session.execute(query)
-        events = result.scalars().all()
 
         return {
             "events": [
                 {
-                    "id": event.id,
-                    "event_type": event.event_type,
-                    "actor_id": event.actor_id,
-                    "channel_id": event.channel_id,
-                    "thread_ts": event.thread_ts,
-                    "result": event.result,
-                    "created_at": event.created_at.isoformat(),
+                    "id": row.id,
+                    "event_type": row.event_type,
+                    "actor_id": row.actor_id,
+                    "channel_id": row.channel_id,
+                    "thread_ts": row.thread_ts,
+                    "result": row.result,
+                    "created_at": row.created_at.isoformat(),
                 }
-                for event in events
+                for row in result
             ],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
         }
 
 
 @app.get("/api/metrics_summary")
 async def get_metrics_summary() -> dict[str, Any]:
     """Get summary of Prometheus metrics."""
-    # Collect metrics from Prometheus registry
-    metrics_data = {}
+    return await _metrics_summary_cache.get(_compute_metrics_summary)
+
 
-    # Get message metrics
+async def _compute_metrics_summary() -> dict[str, Any]:
+    """Snapshot the bot's Prometheus metrics."""
+    metrics_data: dict[str, list[dict[str, Any]]] = {}
+
+    # The bot registry only holds slack_rag_* metrics, so no name filtering is needed
     for metric in REGISTRY.collect():
-        if metric.name.startswith("slack_rag_"):
-            for sample in metric.samples:
-                if sample.name not in metrics_data:
-                    metrics_data[sample.name] = []
-                metrics_data[sample.name].append(
-                    {"labels": sample.labels, "value": sample.value}
-                )
+        for sample in metric.samples:
+            metrics_data.setdefault(sample.name, []).append(
+                {"labels": sample.labels, "value": sample.value}
+            )
 
     return {
         "metrics": metrics_data,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
@@ -246,17 +371,18 @@ async def metrics() -> Any:
 @app.get("/api/channel_stats")
 async def get_channel_stats() -> dict[str, Any]:
     """Get statistics by channel."""
-    async with AsyncSessionLocal() as session:
+    return await _channel_stats_cache.get(_compute_channel_stats)
+
+
+async def _compute_channel_stats() -> dict[str, Any]:
+    """Query statistics by channel.
+
+    Returns:
+        Channel statistics payload
+    """
+    async with ReadSessionLocal() as session:
         # Conversations by channel
-        channel_stats = await session.execute(
-            select(
-                Conversation.channel_id,
-                func.count(Conversation.id).label("total"),
-                func.count(
-                    func.nullif(Conversation.status != ConversationStatus.ACTIVE, False)
-                ).label("active"),
-            ).group_by(Conversation.channel_id)
-        )
+        channel_stats = await session.execute(_CHANNEL_STATS)
 
         stats = []
         for row in channel_stats.all():
@@ -270,7 +396,7 @@ async def get_channel_stats() -> dict[str, Any]:
 
         return {
             "channel_stats": stats,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
         }
 
 
@@ -286,7 +412,9 @@ async def websocket_logs(websocket: WebSocket) -> None:
 
             # Echo back (or handle client commands)
             if data == "ping":
-                await websocket.send_json({"type": "pong", "timestamp": datetime.utcnow().isoformat()})
+                await websocket.send_text(
+                    orjson.dumps({"type": "pong", "timestamp": datetime.now(UTC)}).decode()
+                )
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -304,11 +432,13 @@ async def websocket_metrics(websocket: WebSocket) -> None:
         while True:
             # Send metrics every 5 seconds
             stats = await get_stats()
-            await websocket.send_json(
-                {
-                    "type": "stats_update",
-                    "data": stats,
-                }
+            await websocket.send_text(
+                orjson.dumps(
+                    {
+                        "type": "stats_update",
+                        "data": stats,
+                    }
+                ).decode()
             )
             await asyncio.sleep(5)
 
@@ -328,7 +458,7 @@ async def broadcast_log(log_entry: dict[str, Any]) -> None:
         {
             "type": "log",
             "data": log_entry,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
         }
     )
 
@@ -1,21 +1,11 @@
 """Pytest configuration and shared fixtures."""
 
-import asyncio
 import pytest
-from typing import AsyncGenerator, Generator
 from unittest.mock import MagicMock
 
 from src.config.settings import Settings
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def mock_settings() -> Settings:
     """Create mock settings for testing."""
@@ -89,11 +79,3 @@ def sample_slack_file() -> dict:
         "url_private": "https://files.slack.com/files-pri/T123-F123/test.png",
         "size": 12345,
     }
-
-
-# Mark all async tests
-def pytest_collection_modifyitems(items):
-    """Automatically mark async tests."""
-    for item in items:
-        if asyncio.iscoroutinefunction(item.function):
-            item.add_marker(pytest.mark.asyncio)
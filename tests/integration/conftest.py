@@ -0,0 +1,103 @@
+"""Shared database fixtures for integration tests.
+
+The schema is created and a connection opened once per test session. Each
+test runs inside an outer transaction on that connection that is rolled back
+afterwards, so tests stay isolated without re-running the DDL. Tests using
+these fixtures must run on the session event loop
+(``pytest.mark.asyncio(loop_scope="session")``).
+"""
+
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.models.base import Base, _set_sqlite_pragmas
+from src.slack.services.conversation_service import ConversationService
+
+# Register every model with the metadata before creating tables
+import src.models.action  # noqa: F401
+import src.models.audit  # noqa: F401
+import src.models.feedback  # noqa: F401
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine():
+    """Create the test database engine and schema once per session."""
+    # An in-memory database lives and dies with its connection, so every
+    # session must share the one connection a StaticPool holds
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # The sqlite driver defers BEGIN on its own, which breaks SAVEPOINTs;
+    # let SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _shared_connection(test_engine):
+    """Hold the engine's single connection for the whole session."""
+    async with test_engine.connect() as conn:
+        yield conn
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_connection(_shared_connection):
+    """Start an outer transaction that is rolled back after the test."""
+    transaction = await _shared_connection.begin()
+    try:
+        yield _shared_connection
+    finally:
+        await transaction.rollback()
+
+
+def _savepoint_sessions(conn) -> async_sessionmaker[AsyncSession]:
+    """Build sessions that commit to a SAVEPOINT inside the test transaction."""
+    return async_sessionmaker(
+        bind=conn,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_session(test_connection):
+    """Create a session whose changes are rolled back after the test."""
+    async with _savepoint_sessions(test_connection)() as session:
+        yield session
+
+
+@pytest.fixture
+def conv_service(test_connection):
+    """Create a conversation service whose sessions join the test transaction.
+
+    A fresh service per test keeps its id caches from outliving rolled-back rows.
+    """
+    with patch(
+        "src.slack.services.conversation_service.AsyncSessionLocal",
+        _savepoint_sessions(test_connection),
+    ):
+        yield ConversationService()
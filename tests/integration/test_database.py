@@ -2,45 +2,33 @@
 
 import pytest
 from datetime import datetime
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import bindparam, func, insert, select
 
-from src.models.base import Base
 from src.models.conversation import Conversation, ConversationStatus, QuestionType, Message
 from src.models.action import ActionRun, ActionStatus
 from src.models.feedback import Feedback, FeedbackRating
 from src.models.audit import AuditEvent
-from src.slack.services.conversation_service import ConversationService
-from src.config.settings import Settings
 
+# Fixed timestamp for columns the tests set but never compare
+NOW = datetime(2024, 1, 1)
 
-@pytest.fixture
-async def test_engine():
-    """Create test database engine."""
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False,
-    )
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+ACTION_PARAMETERS = {"service": "api-server"}
+ACTION_RESULT = '{"status": "success"}'
+AUDIT_PAYLOAD = {"text": "test"}
 
-    yield engine
+# Built once so repeated queries reuse the compiled statement
+_COUNT_CONVERSATIONS_BY_CHANNEL = (
+    select(func.count())
+    .select_from(Conversation)
+    .where(Conversation.channel_id == bindparam("channel_id"))
+)
+_COUNT_CONVERSATIONS_BY_CHANNEL_AND_STATUS = _COUNT_CONVERSATIONS_BY_CHANNEL.where(
+    Conversation.status == bindparam("status")
+)
 
-    await engine.dispose()
 
-
-@pytest.fixture
-async def test_session(test_engine):
-    """Create test database session."""
-    async_session = sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session() as session:
-        yield session
+# Shares the session-scoped engine from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 @pytest.mark.asyncio
@@ -55,7 +43,6 @@ async def test_conversation_crud(test_session):
     )
     test_session.add(conv)
     await test_session.commit()
-    await test_session.refresh(conv)
 
     assert conv.id is not None
     assert conv.channel_id == "C123"
@@ -65,25 +52,62 @@ async def test_conversation_crud(test_session):
     conv.status = ConversationStatus.RESOLVED
     conv.question_type = QuestionType.BUG
     await test_session.commit()
-    await test_session.refresh(conv)
 
     assert conv.status == ConversationStatus.RESOLVED
     assert conv.question_type == QuestionType.BUG
 
     # Read
-    from sqlalchemy import select
-    result = await test_session.execute(
-        select(Conversation).where(Conversation.id == conv.id)
-    )
-    found_conv = result.scalar_one()
+    found_conv = await test_session.get(Conversation, conv.id)
 
     assert found_conv.id == conv.id
     assert found_conv.channel_id == "C123"
 
 
+# (model, column values, column checked after reading back, expected value)
+CHILD_CASES = [
+    pytest.param(
+        Message,
+        {
+            "ts": "1234567890.123456",
+            "user_id": "U123",
+            "text": "Test message",
+            "has_files": False,
+            "is_bot_response": False,
+        },
+        "text",
+        "Test message",
+        id="message",
+    ),
+    pytest.param(
+        ActionRun,
+        {
+            "action_name": "restart_service",
+            "parameters": ACTION_PARAMETERS,
+            "status": ActionStatus.PENDING_APPROVAL,
+        },
+        "status",
+        ActionStatus.PENDING_APPROVAL,
+        id="action_run",
+    ),
+    pytest.param(
+        Feedback,
+        {
+            "user_id": "U123",
+            "rating": FeedbackRating.HELPFUL,
+            "message_ts": "1234567890.123456",
+            "note": "Very helpful!",
+        },
+        "rating",
+        FeedbackRating.HELPFUL,
+        id="feedback",
+    ),
+]
+
+
 @pytest.mark.asyncio
-async def test_message_crud(test_session):
-    """Test message CRUD operations."""
+@pytest.mark.parametrize(("model", "values", "column", "expected"), CHILD_CASES)
+async def test_child_crud(test_session, model, values, column, expected):
+    """Test create and read for records that belong to a conversation."""
     # Create conversation first
     conv = Conversation(
         channel_id="C123",
@@ -92,41 +116,27 @@ async def test_message_crud(test_session):
         status=ConversationStatus.ACTIVE,
     )
     test_session.add(conv)
-    await test_session.commit()
-    await test_session.refresh(conv)
+    await test_session.flush()
 
-    # Create message
-    msg = Message(
-        conversation_id=conv.id,
-        ts="1234567890.123456",
-        user_id="U123",
-        text="Test message",
-        has_files=False,
-        is_bot_response=False,
-    )
-    test_session.add(msg)
+    # Create child record
+    obj = model(conversation_id=conv.id, **values)
+    test_session.add(obj)
     await test_session.commit()
-    await test_session.refresh(msg)
 
-    assert msg.id is not None
-    assert msg.conversation_id == conv.id
-    assert msg.text == "Test message"
+    assert obj.id is not None
+    assert obj.conversation_id == conv.id
 
     # Read
-    from sqlalchemy import select
     result = await test_session.execute(
-        select(Message).where(Message.conversation_id == conv.id)
+        select(getattr(model, column)).where(model.conversation_id == conv.id)
     )
-    messages = result.scalars().all()
 
-    assert len(messages) == 1
-    assert messages[0].text == "Test message"
+    assert result.scalars().all() == [expected]
 
 
 @pytest.mark.asyncio
-async def test_action_run_crud(test_session):
-    """Test action run CRUD operations."""
-    # Create conversation first
+async def test_action_run_status_updates(test_session):
+    """Test action run status transitions."""
     conv = Conversation(
         channel_id="C123",
         thread_ts="1234567890.123456",
@@ -134,27 +144,21 @@ async def test_action_run_crud(test_session):
         status=ConversationStatus.ACTIVE,
     )
     test_session.add(conv)
-    await test_session.commit()
-    await test_session.refresh(conv)
+    await test_session.flush()
 
-    # Create action
     action = ActionRun(
         conversation_id=conv.id,
         action_name="restart_service",
-        parameters='{"service": "api-server"}',
+        parameters=ACTION_PARAMETERS,
         status=ActionStatus.PENDING_APPROVAL,
     )
     test_session.add(action)
-    await test_session.commit()
-    await test_session.refresh(action)
-
-    assert action.id is not None
-    assert action.status == ActionStatus.PENDING_APPROVAL
+    await test_session.flush()
 
     # Update status
     action.status = ActionStatus.APPROVED
     action.approved_by = "U456"
-    action.approved_at = datetime.utcnow()
+    action.approved_at = NOW
     await test_session.commit()
     await test_session.refresh(action)
 
@@ -163,59 +167,18 @@ async def test_action_run_crud(test_session):
 
     # Execute action
     action.status = ActionStatus.RUNNING
-    action.executed_at = datetime.utcnow()
+    action.executed_at = NOW
     await test_session.commit()
 
     action.status = ActionStatus.COMPLETED
-    action.completed_at = datetime.utcnow()
-    action.result = '{"status": "success"}'
+    action.completed_at = NOW
+    action.result = ACTION_RESULT
     await test_session.commit()
-    await test_session.refresh(action)
 
     assert action.status == ActionStatus.COMPLETED
     assert action.result is not None
 
 
-@pytest.mark.asyncio
-async def test_feedback_crud(test_session):
-    """Test feedback CRUD operations."""
-    # Create conversation first
-    conv = Conversation(
-        channel_id="C123",
-        thread_ts="1234567890.123456",
-        user_id="U123",
-        status=ConversationStatus.ACTIVE,
-    )
-    test_session.add(conv)
-    await test_session.commit()
-    await test_session.refresh(conv)
-
-    # Create feedback
-    feedback = Feedback(
-        conversation_id=conv.id,
-        user_id="U123",
-        rating=FeedbackRating.HELPFUL,
-        message_ts="1234567890.123456",
-        note="Very helpful!",
-    )
-    test_session.add(feedback)
-    await test_session.commit()
-    await test_session.refresh(feedback)
-
-    assert feedback.id is not None
-    assert feedback.rating == FeedbackRating.HELPFUL
-
-    # Read
-    from sqlalchemy import select
-    result = await test_session.execute(
-        select(Feedback).where(Feedback.conversation_id == conv.id)
-    )
-    feedbacks = result.scalars().all()
-
-    assert len(feedbacks) == 1
-    assert feedbacks[0].rating == FeedbackRating.HELPFUL
-
-
 @pytest.mark.asyncio
 async def test_audit_event_crud(test_session):
     """Test audit event CRUD operations."""
@@ -225,27 +188,23 @@ async def test_audit_event_crud(test_session):
         actor_id="U123",
         channel_id="C123",
         thread_ts="1234567890.123456",
-        payload='{"text": "test"}',
+        payload=AUDIT_PAYLOAD,
         payload_hash="abc123",
         result="success",
     )
     test_session.add(event)
     await test_session.commit()
-    await test_session.refresh(event)
 
     assert event.id is not None
     assert event.event_type == "message_received"
     assert event.result == "success"
 
     # Read
-    from sqlalchemy import select
     result = await test_session.execute(
-        select(AuditEvent).where(AuditEvent.actor_id == "U123")
+        select(AuditEvent.event_type).where(AuditEvent.actor_id == "U123")
     )
-    events = result.scalars().all()
 
-    assert len(events) == 1
-    assert events[0].event_type == "message_received"
+    assert result.scalars().all() == ["message_received"]
 
 
 @pytest.mark.asyncio
@@ -259,47 +218,46 @@ async def test_conversation_with_messages(test_session):
         status=ConversationStatus.ACTIVE,
     )
     test_session.add(conv)
-    await test_session.commit()
-    await test_session.refresh(conv)
+    await test_session.flush()
 
     # Add multiple messages
-    messages = [
-        Message(
-            conversation_id=conv.id,
-            ts="1234567890.123456",
-            user_id="U123",
-            text="Initial question",
-            has_files=False,
-            is_bot_response=False,
-        ),
-        Message(
-            conversation_id=conv.id,
-            ts="1234567891.123456",
-            user_id="UBOT",
-            text="Bot response",
-            has_files=False,
-            is_bot_response=True,
-        ),
-        Message(
-            conversation_id=conv.id,
-            ts="1234567892.123456",
-            user_id="U123",
-            text="Follow-up question",
-            has_files=False,
-            is_bot_response=False,
-        ),
-    ]
-
-    for msg in messages:
-        test_session.add(msg)
-    await test_session.commit()
+    await test_session.execute(
+        insert(Message),
+        [
+            {
+                "conversation_id": conv.id,
+                "ts": "1234567890.123456",
+                "user_id": "U123",
+                "text": "Initial question",
+                "has_files": False,
+                "is_bot_response": False,
+            },
+            {
+                "conversation_id": conv.id,
+                "ts": "1234567891.123456",
+                "user_id": "UBOT",
+                "text": "Bot response",
+                "has_files": False,
+                "is_bot_response": True,
+            },
+            {
+                "conversation_id": conv.id,
+                "ts": "1234567892.123456",
+                "user_id": "U123",
+                "text": "Follow-up question",
+                "has_files": False,
+                "is_bot_response": False,
+            },
+        ],
+    )
 
     # Read all messages
-    from sqlalchemy import select
     result = await test_session.execute(
-        select(Message).where(Message.conversation_id == conv.id).order_by(Message.ts)
+        select(Message.text, Message.is_bot_response)
+        .where(Message.conversation_id == conv.id)
+        .order_by(Message.ts)
     )
-    saved_messages = result.scalars().all()
+    saved_messages = result.all()
 
     assert len(saved_messages) == 3
     assert saved_messages[0].text == "Initial question"
@@ -319,7 +277,6 @@ async def test_conversation_lifecycle(test_session):
     )
     test_session.add(conv)
     await test_session.commit()
-    await test_session.refresh(conv)
 
     assert conv.status == ConversationStatus.ACTIVE
 
@@ -336,7 +293,7 @@ async def test_conversation_lifecycle(test_session):
 
     # 4. Approve and resolve
     conv.status = ConversationStatus.RESOLVED
-    conv.resolved_at = datetime.utcnow()
+    conv.resolved_at = NOW
     await test_session.commit()
 
     assert conv.status == ConversationStatus.RESOLVED
@@ -344,24 +301,10 @@ async def test_conversation_lifecycle(test_session):
 
 
 @pytest.mark.asyncio
-async def test_conversation_service_integration(test_engine):
+async def test_conversation_service_integration(conv_service):
     """Test ConversationService with real database."""
-    from unittest.mock import MagicMock
-
-    # Create mock settings
-    settings = MagicMock(spec=Settings)
-    settings.database_url = "sqlite+aiosqlite:///:memory:"
-
-    # Create service with test engine
-    service = ConversationService(settings)
-    service.engine = test_engine
-
-    # Create tables
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
     # Test get or create
-    conv = await service.get_or_create_conversation(
+    conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
         thread_ts="1234567890.123456",
         user_id="U123",
@@ -372,7 +315,7 @@ async def test_conversation_service_integration(test_engine):
     assert conv.channel_id == "C123"
 
     # Test get existing
-    conv2 = await service.get_or_create_conversation(
+    conv2 = await conv_service.get_or_create_conversation(
         channel_id="C123",
         thread_ts="1234567890.123456",
         user_id="U123",
@@ -385,47 +328,39 @@ async def test_conversation_service_integration(test_engine):
 async def test_multiple_conversations_same_channel(test_session):
     """Test multiple conversations in same channel."""
     # Create multiple conversations
-    conversations = [
-        Conversation(
-            channel_id="C123",
-            thread_ts="1234567890.123456",
-            user_id="U123",
-            status=ConversationStatus.ACTIVE,
-        ),
-        Conversation(
-            channel_id="C123",
-            thread_ts="1234567891.123456",
-            user_id="U456",
-            status=ConversationStatus.ACTIVE,
-        ),
-        Conversation(
-            channel_id="C123",
-            thread_ts="1234567892.123456",
-            user_id="U789",
-            status=ConversationStatus.RESOLVED,
-        ),
-    ]
-
-    for conv in conversations:
-        test_session.add(conv)
-    await test_session.commit()
+    await test_session.execute(
+        insert(Conversation),
+        [
+            {
+                "channel_id": "C123",
+                "thread_ts": "1234567890.123456",
+                "user_id": "U123",
+                "status": ConversationStatus.ACTIVE,
+            },
+            {
+                "channel_id": "C123",
+                "thread_ts": "1234567891.123456",
+                "user_id": "U456",
+                "status": ConversationStatus.ACTIVE,
+            },
+            {
+                "channel_id": "C123",
+                "thread_ts": "1234567892.123456",
+                "user_id": "U789",
+                "status": ConversationStatus.RESOLVED,
+            },
+        ],
+    )
 
     # Query conversations by channel
-    from sqlalchemy import select
-    result = await test_session.execute(
-        select(Conversation).where(Conversation.channel_id == "C123")
-    )
-    channel_convs = result.scalars().all()
+    total = await test_session.scalar(_COUNT_CONVERSATIONS_BY_CHANNEL, {"channel_id": "C123"})
 
-    assert len(channel_convs) == 3
+    assert total == 3
 
     # Query active conversations only
-    result = await test_session.execute(
-        select(Conversation).where(
-            Conversation.channel_id == "C123",
-            Conversation.status == ConversationStatus.ACTIVE,
-        )
+    active = await test_session.scalar(
+        _COUNT_CONVERSATIONS_BY_CHANNEL_AND_STATUS,
+        {"channel_id": "C123", "status": ConversationStatus.ACTIVE},
     )
-    active_convs = result.scalars().all()
 
-    assert len(active_convs) == 2
+    assert active == 2
@@ -1,37 +1,26 @@
 """Integration tests for Slack message flow."""
 
 import pytest
+from sqlalchemy import select
 from unittest.mock import AsyncMock, MagicMock, patch
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 
 from src.models.base import Base
 from src.models.conversation import Conversation, ConversationStatus, QuestionType
-from src.slack.services.conversation_service import ConversationService
+from src.slack.services.conversation_service import _SELECT_CONVERSATION_BY_THREAD
 from src.slack.services.message_processor import MessageProcessor
 from src.config.settings import Settings
 from src.config.channel_config import ChannelConfigManager, ChannelConfig
 
 
-@pytest.fixture
-async def test_engine():
-    """Create test database engine."""
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False,
-    )
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+SCREENSHOT_URL = "https://files.slack.com/screenshot.png"
 
-    yield engine
+# Shares the session-scoped engine behind conv_service from conftest.py
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-    await engine.dispose()
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings."""
+    """Create mock settings shared by the module's tests."""
     settings = MagicMock(spec=Settings)
     settings.database_url = "sqlite+aiosqlite:///:memory:"
     settings.debug = True
@@ -40,9 +29,12 @@ def mock_settings():
     return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_channel_manager():
-    """Create mock channel manager."""
+    """Create mock channel manager shared by the module's tests.
+
+    Tests that need a different channel config must restore it afterwards.
+    """
     manager = MagicMock(spec=ChannelConfigManager)
     config = ChannelConfig(
         channel_id="C123",
@@ -55,13 +47,9 @@ def mock_channel_manager():
     return manager
 
 
-@pytest.mark.asyncio
-async def test_new_message_flow(test_engine, mock_settings, mock_channel_manager):
+async def test_new_message_flow(conv_service, mock_settings, mock_channel_manager):
     """Test complete flow for new message."""
     # Setup
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     msg_processor = MessageProcessor(mock_settings, mock_channel_manager)
 
     mock_client = AsyncMock()
@@ -83,7 +71,6 @@ async def test_new_message_flow(test_engine, mock_settings, mock_channel_manager
         ts="1234567890.123456",
         user_id="U123",
         text="I found a critical bug in the payment system",
-        has_files=False,
         is_bot_response=False,
     )
 
@@ -102,12 +89,8 @@ async def test_new_message_flow(test_engine, mock_settings, mock_channel_manager
     mock_say.assert_called()
 
 
-@pytest.mark.asyncio
-async def test_conversation_classification_flow(test_engine, mock_settings):
+async def test_conversation_classification_flow(conv_service, mock_settings):
     """Test conversation classification flow."""
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     # Create conversation
     conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
@@ -122,20 +105,17 @@ async def test_conversation_classification_flow(test_engine, mock_settings):
     )
 
     # Verify classification
-    updated_conv = await conv_service.get_conversation_by_thread(
+    updated_conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
         thread_ts="1234567890.123456",
+        user_id="U123",
     )
 
     assert updated_conv.question_type == QuestionType.BUG
 
 
-@pytest.mark.asyncio
-async def test_multi_message_conversation(test_engine, mock_settings, mock_channel_manager):
+async def test_multi_message_conversation(conv_service, mock_settings, mock_channel_manager):
     """Test conversation with multiple messages."""
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     msg_processor = MessageProcessor(mock_settings, mock_channel_manager)
 
     mock_client = AsyncMock()
@@ -154,7 +134,6 @@ async def test_multi_message_conversation(test_engine, mock_settings, mock_chann
         ts="1234567890.123456",
         user_id="U123",
         text="How do I configure the API?",
-        has_files=False,
         is_bot_response=False,
     )
 
@@ -174,7 +153,6 @@ async def test_multi_message_conversation(test_engine, mock_settings, mock_chann
         ts="1234567891.123456",
         user_id="UBOT",
         text="You can configure the API by...",
-        has_files=False,
         is_bot_response=True,
     )
 
@@ -187,7 +165,6 @@ async def test_multi_message_conversation(test_engine, mock_settings, mock_chann
         ts="1234567892.123456",
         user_id="U123",
         text="Thanks! What about authentication?",
-        has_files=False,
         is_bot_response=False,
     )
 
@@ -202,22 +179,21 @@ async def test_multi_message_conversation(test_engine, mock_settings, mock_chann
     )
 
     # Verify conversation has multiple messages
-    updated_conv = await conv_service.get_conversation_by_thread(
+    updated_conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
         thread_ts="1234567890.123456",
+        user_id="U123",
+        load_messages=True,
     )
 
+    assert len(updated_conv.messages) == 3
     assert updated_conv.first_response_at is not None
 
 
-@pytest.mark.asyncio
-async def test_feedback_flow(test_engine, mock_settings):
+async def test_feedback_flow(conv_service, mock_settings):
     """Test feedback capture flow."""
     from src.models.feedback import FeedbackRating
 
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     # Create conversation
     conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
@@ -231,7 +207,6 @@ async def test_feedback_flow(test_engine, mock_settings):
         ts="1234567890.123456",
         user_id="UBOT",
         text="Here's the answer",
-        has_files=False,
         is_bot_response=True,
     )
 
@@ -249,12 +224,8 @@ async def test_feedback_flow(test_engine, mock_settings):
     assert True  # Placeholder
 
 
-@pytest.mark.asyncio
-async def test_escalation_flow(test_engine, mock_settings):
+async def test_escalation_flow(conv_service, test_session):
     """Test conversation escalation flow."""
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     # Create conversation
     conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
@@ -263,36 +234,27 @@ async def test_escalation_flow(test_engine, mock_settings):
     )
 
     # Set as escalated
-    async with conv_service._get_session() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(Conversation).where(Conversation.id == conv.id)
-        )
-        conv_obj = result.scalar_one()
-        conv_obj.status = ConversationStatus.ESCALATED
-        conv_obj.escalated_to = "U456"
-        conv_obj.jira_key = "TEST-123"
-        await session.commit()
+    conv_obj = await test_session.get(Conversation, conv.id)
+    conv_obj.status = ConversationStatus.ESCALATED
+    conv_obj.escalated_to = "U456"
+    conv_obj.jira_key = "TEST-123"
+    await test_session.commit()
 
     # Verify escalation
-    updated_conv = await conv_service.get_conversation_by_thread(
-        channel_id="C123",
-        thread_ts="1234567890.123456",
+    result = await test_session.execute(
+        _SELECT_CONVERSATION_BY_THREAD, {"thread_ts": "1234567890.123456"}
     )
+    updated_conv = result.scalar_one()
 
     assert updated_conv.status == ConversationStatus.ESCALATED
     assert updated_conv.escalated_to == "U456"
     assert updated_conv.jira_key == "TEST-123"
 
 
-@pytest.mark.asyncio
-async def test_action_approval_flow(test_engine, mock_settings):
+async def test_action_approval_flow(conv_service, test_session):
     """Test action approval flow."""
     from src.models.action import ActionRun, ActionStatus
 
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     # Create conversation
     conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
@@ -301,46 +263,33 @@ async def test_action_approval_flow(test_engine, mock_settings):
     )
 
     # Create action requiring approval
-    async with conv_service._get_session() as session:
-        action = ActionRun(
-            conversation_id=conv.id,
-            action_name="restart_service",
-            parameters='{"service": "api-server"}',
-            status=ActionStatus.PENDING_APPROVAL,
-        )
-        session.add(action)
-        await session.commit()
-        await session.refresh(action)
-        action_id = action.id
+    action = ActionRun(
+        conversation_id=conv.id,
+        action_name="restart_service",
+        parameters={"service": "api-server"},
+        status=ActionStatus.PENDING_APPROVAL,
+    )
+    test_session.add(action)
+    await test_session.flush()
 
     # Approve action
-    async with conv_service._get_session() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(ActionRun).where(ActionRun.id == action_id)
-        )
-        action_obj = result.scalar_one()
-        action_obj.status = ActionStatus.APPROVED
-        action_obj.approved_by = "U456"
-        await session.commit()
+    action.status = ActionStatus.APPROVED
+    action.approved_by = "U456"
+    await test_session.commit()
 
     # Verify approval
-    async with conv_service._get_session() as session:
-        result = await session.execute(
-            select(ActionRun).where(ActionRun.id == action_id)
+    approved_action = (
+        await test_session.execute(
+            select(ActionRun.status, ActionRun.approved_by).where(ActionRun.id == action.id)
         )
-        approved_action = result.scalar_one()
+    ).one()
 
     assert approved_action.status == ActionStatus.APPROVED
     assert approved_action.approved_by == "U456"
 
 
-@pytest.mark.asyncio
-async def test_concurrent_conversations(test_engine, mock_settings):
+async def test_concurrent_conversations(conv_service, mock_settings):
     """Test multiple concurrent conversations."""
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     # Create multiple conversations concurrently
     conv1 = await conv_service.get_or_create_conversation(
         channel_id="C123",
@@ -366,12 +315,8 @@ async def test_concurrent_conversations(test_engine, mock_settings):
     assert conv1.channel_id != conv3.channel_id
 
 
-@pytest.mark.asyncio
-async def test_message_with_files_flow(test_engine, mock_settings, mock_channel_manager):
+async def test_message_with_files_flow(conv_service, mock_settings, mock_channel_manager):
     """Test message with file attachments flow."""
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     msg_processor = MessageProcessor(mock_settings, mock_channel_manager)
 
     mock_client = AsyncMock()
@@ -389,7 +334,7 @@ async def test_message_with_files_flow(test_engine, mock_settings, mock_channel_
         {
             "id": "F123",
             "name": "screenshot.png",
-            "url_private": "https://files.slack.com/screenshot.png",
+            "url_private": SCREENSHOT_URL,
         }
     ]
 
@@ -398,8 +343,7 @@ async def test_message_with_files_flow(test_engine, mock_settings, mock_channel_
         ts="1234567890.123456",
         user_id="U123",
         text="Check this screenshot of the error",
-        has_files=True,
-        file_urls='["https://files.slack.com/screenshot.png"]',
+        files=files,
         is_bot_response=False,
     )
 
@@ -417,12 +361,8 @@ async def test_message_with_files_flow(test_engine, mock_settings, mock_channel_
     mock_say.assert_called()
 
 
-@pytest.mark.asyncio
-async def test_resolution_flow(test_engine, mock_settings):
+async def test_resolution_flow(conv_service, test_session):
     """Test conversation resolution flow."""
-    conv_service = ConversationService(mock_settings)
-    conv_service.engine = test_engine
-
     # Create and resolve conversation
     conv = await conv_service.get_or_create_conversation(
         channel_id="C123",
@@ -431,21 +371,17 @@ async def test_resolution_flow(test_engine, mock_settings):
     )
 
     # Update to resolved
-    async with conv_service._get_session() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(Conversation).where(Conversation.id == conv.id)
-        )
-        conv_obj = result.scalar_one()
-        conv_obj.status = ConversationStatus.RESOLVED
-        conv_obj.summary = "Issue resolved successfully"
-        await session.commit()
+    conv_obj = await test_session.get(Conversation, conv.id)
+    conv_obj.status = ConversationStatus.RESOLVED
+    conv_obj.summary = "Issue resolved successfully"
+    await test_session.commit()
 
     # Verify resolution
-    updated_conv = await conv_service.get_conversation_by_thread(
-        channel_id="C123",
-        thread_ts="1234567890.123456",
-    )
+    updated_conv = (
+        await test_session.execute(
+            select(Conversation.status, Conversation.summary).where(Conversation.id == conv.id)
+        )
+    ).one()
 
     assert updated_conv.status == ConversationStatus.RESOLVED
     assert updated_conv.summary == "Issue resolved successfully"
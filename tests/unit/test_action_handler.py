@@ -1,20 +1,86 @@
 """Tests for action handler."""
 
+import copy
+from types import MappingProxyType
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.slack.handlers.action import setup_action_handlers
+from src.slack.handlers.action import register_action_handlers
 from src.config.channel_config import ChannelConfigManager
 from src.config.settings import Settings
 
 
-@pytest.fixture
+# Handlers only read action bodies, so tests share these read-only copies
+_APPROVE_SUMMARY_BODY = MappingProxyType(
+    {
+        "user": {"id": "U123"},
+        "actions": [{"action_id": "approve_summary"}],
+        "channel": {"id": "C123"},
+        "message": {
+            "ts": "1234567890.123456",
+            "metadata": {"event_payload": {"thread_ts": "1234567890.000001"}},
+        },
+    }
+)
+_CANCEL_SUMMARY_BODY = MappingProxyType(
+    {
+        "user": {"id": "U123"},
+        "actions": [{"action_id": "cancel_summary"}],
+        "channel": {"id": "C123"},
+        "message": {"ts": "1234567890.123456"},
+    }
+)
+_EDIT_SUMMARY_BODY = MappingProxyType(
+    {
+        "user": {"id": "U123"},
+        "actions": [{"action_id": "edit_summary"}],
+        "trigger_id": "T123",
+        "channel": {"id": "C123"},
+        "message": {"ts": "1234567890.123456"},
+    }
+)
+_APPROVE_ACTION_BODY = MappingProxyType(
+    {
+        "user": {"id": "U123"},
+        "actions": [{"action_id": "approve_action"}],
+        "channel": {"id": "C123"},
+        "message": {
+            "ts": "1234567890.123456",
+            "metadata": {
+                "event_payload": {"action_id": 1, "thread_ts": "1234567890.000001"}
+            },
+        },
+    }
+)
+_REJECT_ACTION_BODY = MappingProxyType(
+    {
+        "user": {"id": "U123"},
+        "actions": [{"action_id": "reject_action"}],
+        "channel": {"id": "C123"},
+        "message": {"ts": "1234567890.123456"},
+    }
+)
+
+
+@pytest.fixture(scope="module")
 def mock_app():
-    """Create mock Slack app."""
-    return MagicMock()
+    """Create mock Slack app that records the registered action handlers."""
+    app = MagicMock()
+    app.registered_actions = {}
+
+    def action(action_id):
+        def register(handler):
+            app.registered_actions[action_id] = handler
+            return handler
 
+        return register
 
-@pytest.fixture
+    app.action.side_effect = action
+    return app
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
     """Create mock settings."""
     settings = MagicMock(spec=Settings)
@@ -22,301 +88,186 @@ def mock_settings():
     return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_channel_manager():
     """Create mock channel manager."""
     return MagicMock(spec=ChannelConfigManager)
 
 
-def test_setup_action_handlers(mock_app, mock_settings, mock_channel_manager):
-    """Test setting up action handlers."""
-    setup_action_handlers(mock_app, mock_settings, mock_channel_manager)
+@pytest.fixture(scope="module")
+def _action_service_patch():
+    """Patch the handlers' ActionService once for the module."""
+    with patch("src.slack.handlers.action.ActionService") as service_cls:
+        service_cls.return_value = AsyncMock()
+        yield service_cls
 
-    # Should register action handlers
-    assert mock_app.action.called or mock_app.view.called
 
+@pytest.fixture(scope="module")
+def handlers(_action_service_patch, mock_app, mock_settings, mock_channel_manager):
+    """Register the action handlers once and get them by action ID."""
+    register_action_handlers(mock_app, mock_settings, mock_channel_manager)
+    return mock_app.registered_actions
 
-@pytest.mark.asyncio
-async def test_handle_approve_summary_action():
-    """Test handling approve summary action."""
-    mock_ack = AsyncMock()
-    mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [{"action_id": "approve_summary"}],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
-
-    with patch("src.slack.handlers.action.ActionService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
 
-        from src.slack.handlers.action import handle_approve_summary
+@pytest.fixture(autouse=True)
+def mock_service(_action_service_patch, handlers):
+    """Get the ActionService instance the handlers use, reset for each test."""
+    service = _action_service_patch.return_value
+    service.reset_mock(side_effect=True)
+    return service
 
-        await handle_approve_summary(mock_ack, mock_body, mock_client)
 
-        # Should acknowledge and handle approval
-        mock_ack.assert_called_once()
-        mock_service_instance.handle_summary_approval.assert_called_once()
+def test_register_action_handlers(
+    handlers, mock_settings, mock_channel_manager, _action_service_patch
+):
+    """Test registering action handlers."""
+    assert set(handlers) == {
+        "approve_summary",
+        "edit_summary",
+        "cancel_summary",
+        "approve_action",
+        "reject_action",
+    }
+    _action_service_patch.assert_called_once_with(mock_settings, mock_channel_manager)
 
 
 @pytest.mark.asyncio
-async def test_handle_reject_summary_action():
-    """Test handling reject summary action."""
+async def test_handle_approve_summary_action(handlers, mock_service):
+    """Test handling approve summary action."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [{"action_id": "reject_summary"}],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
-
-    with patch("src.slack.handlers.action.ActionService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
 
-        from src.slack.handlers.action import handle_reject_summary
+    await handlers["approve_summary"](mock_ack, _APPROVE_SUMMARY_BODY, mock_client)
 
-        await handle_reject_summary(mock_ack, mock_body, mock_client)
-
-        # Should acknowledge and handle rejection
-        mock_ack.assert_called_once()
+    # Should acknowledge and handle approval
+    mock_ack.assert_called_once()
+    mock_service.handle_summary_approval.assert_called_once_with(
+        user_id="U123",
+        channel_id="C123",
+        thread_ts="1234567890.000001",
+        client=mock_client,
+    )
 
 
 @pytest.mark.asyncio
-async def test_handle_approve_action():
-    """Test handling action approval."""
+async def test_handle_approve_summary_missing_thread(handlers, mock_service):
+    """Test that summary approval without thread metadata is skipped."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [
-            {
-                "action_id": "approve_action",
-                "value": "1",  # action_id
-            }
-        ],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
+    mock_body = {**_APPROVE_SUMMARY_BODY, "message": {"ts": "1234567890.123456"}}
 
-    with patch("src.slack.handlers.action.ActionService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
+    await handlers["approve_summary"](mock_ack, mock_body, mock_client)
 
-        from src.slack.handlers.action import handle_approve_action
-
-        await handle_approve_action(mock_ack, mock_body, mock_client)
-
-        # Should acknowledge and handle action approval
-        mock_ack.assert_called_once()
-        mock_service_instance.handle_action_approval.assert_called_once_with(
-            action_id=1,
-            user_id="U123",
-            channel_id="C123",
-            thread_ts="1234567890.123456",
-            client=mock_client,
-        )
+    mock_ack.assert_called_once()
+    mock_service.handle_summary_approval.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_handle_reject_action():
-    """Test handling action rejection."""
+async def test_handle_edit_summary_opens_modal(handlers):
+    """Test that editing a summary opens the edit modal."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [
-            {
-                "action_id": "reject_action",
-                "value": "1",  # action_id
-            }
-        ],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
 
-    with patch("src.slack.handlers.action.ActionService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
+    await handlers["edit_summary"](mock_ack, _EDIT_SUMMARY_BODY, mock_client)
 
-        from src.slack.handlers.action import handle_reject_action
-
-        await handle_reject_action(mock_ack, mock_body, mock_client)
-
-        # Should acknowledge and handle rejection
-        mock_ack.assert_called_once()
+    mock_ack.assert_called_once()
+    mock_client.views_open.assert_called_once()
+    call_kwargs = mock_client.views_open.call_args.kwargs
+    assert call_kwargs["trigger_id"] == "T123"
+    assert call_kwargs["view"]["callback_id"] == "edit_summary_modal"
 
 
 @pytest.mark.asyncio
-async def test_handle_escalate_action():
-    """Test handling escalation action."""
+async def test_handle_cancel_summary_action(handlers):
+    """Test handling cancel summary action."""
     mock_ack = AsyncMock()
-    mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [{"action_id": "escalate"}],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456", "thread_ts": "1234567890.123456"},
-    }
 
-    with patch("src.slack.handlers.action.ConversationService") as mock_conv_service, \
-         patch("src.slack.handlers.action.JiraClient") as mock_jira, \
-         patch("src.slack.handlers.action.EmailClient") as mock_email:
+    await handlers["cancel_summary"](mock_ack, _CANCEL_SUMMARY_BODY)
 
-        mock_conv_instance = AsyncMock()
-        mock_conv_service.return_value = mock_conv_instance
+    # Should acknowledge cancellation
+    mock_ack.assert_called_once()
 
-        mock_jira_instance = AsyncMock()
-        mock_jira_instance.create_issue.return_value = "TEST-123"
-        mock_jira.return_value = mock_jira_instance
 
-        mock_email_instance = AsyncMock()
-        mock_email_instance.send_escalation.return_value = True
-        mock_email.return_value = mock_email_instance
-
-        from src.slack.handlers.action import handle_escalate
+@pytest.mark.asyncio
+async def test_handle_approve_action(handlers, mock_service):
+    """Test handling action approval."""
+    mock_ack = AsyncMock()
+    mock_client = AsyncMock()
 
-        await handle_escalate(mock_ack, mock_body, mock_client)
+    await handlers["approve_action"](mock_ack, _APPROVE_ACTION_BODY, mock_client)
 
-        # Should acknowledge
-        mock_ack.assert_called_once()
+    # Should acknowledge and handle action approval
+    mock_ack.assert_called_once()
+    mock_service.handle_action_approval.assert_called_once_with(
+        action_id=1,
+        user_id="U123",
+        channel_id="C123",
+        thread_ts="1234567890.000001",
+        client=mock_client,
+    )
 
 
 @pytest.mark.asyncio
-async def test_handle_modal_submission():
-    """Test handling modal submission."""
+async def test_handle_reject_action(handlers):
+    """Test handling action rejection."""
     mock_ack = AsyncMock()
-    mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "view": {
-            "callback_id": "feedback_modal",
-            "state": {
-                "values": {
-                    "feedback_block": {
-                        "feedback_input": {
-                            "value": "This is helpful feedback"
-                        }
-                    }
-                }
-            },
-        },
-    }
-
-    with patch("src.slack.handlers.action.ConversationService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
-
-        from src.slack.handlers.action import handle_feedback_modal
 
-        await handle_feedback_modal(mock_ack, mock_body, mock_client)
+    await handlers["reject_action"](mock_ack, _REJECT_ACTION_BODY)
 
-        # Should acknowledge modal submission
-        mock_ack.assert_called_once()
+    # Should acknowledge rejection
+    mock_ack.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_handle_action_error():
+async def test_handle_action_error(handlers, mock_service):
     """Test handling action with error."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [{"action_id": "approve_action", "value": "1"}],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
+    mock_service.handle_action_approval.side_effect = Exception("Database error")
 
-    with patch("src.slack.handlers.action.ActionService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service_instance.handle_action_approval.side_effect = Exception("Database error")
-        mock_service.return_value = mock_service_instance
+    # Should not raise exception
+    await handlers["approve_action"](mock_ack, _APPROVE_ACTION_BODY, mock_client)
 
-        from src.slack.handlers.action import handle_approve_action
-
-        # Should not raise exception
-        await handle_approve_action(mock_ack, mock_body, mock_client)
-
-        # Should still acknowledge
-        mock_ack.assert_called_once()
+    # Should still acknowledge
+    mock_ack.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_handle_action_logs():
+async def test_handle_action_logs(handlers):
     """Test that action handlers log information."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [{"action_id": "approve_summary"}],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
-
-    with patch("src.slack.handlers.action.ActionService") as mock_service, \
-         patch("src.slack.handlers.action.logger") as mock_logger:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
-
-        from src.slack.handlers.action import handle_approve_summary
 
-        await handle_approve_summary(mock_ack, mock_body, mock_client)
+    with patch("src.slack.handlers.action.logger") as mock_logger:
+        await handlers["approve_summary"](mock_ack, _APPROVE_SUMMARY_BODY, mock_client)
 
         # Should log action handling
         assert mock_logger.info.called or mock_logger.debug.called
 
 
 @pytest.mark.asyncio
-async def test_handle_action_unauthorized_user():
-    """Test handling action from unauthorized user."""
+async def test_handle_action_other_user(handlers, mock_service):
+    """Test that approvals are passed on with the clicking user for authorization."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U999"},  # Unauthorized user
-        "actions": [{"action_id": "approve_action", "value": "1"}],
-        "channel": {"id": "C123"},
-        "message": {"ts": "1234567890.123456"},
-    }
-
-    with patch("src.slack.handlers.action.ActionService") as mock_service, \
-         patch("src.slack.handlers.action.ChannelConfigManager") as mock_config:
-
-        mock_config_instance = MagicMock()
-        mock_config_instance.is_approver.return_value = False
-        mock_config.return_value = mock_config_instance
-
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
+    mock_body = {**_APPROVE_ACTION_BODY, "user": {"id": "U999"}}
 
-        from src.slack.handlers.action import handle_approve_action
+    await handlers["approve_action"](mock_ack, mock_body, mock_client)
 
-        await handle_approve_action(mock_ack, mock_body, mock_client)
-
-        # Should acknowledge but not execute
-        mock_ack.assert_called_once()
+    mock_ack.assert_called_once()
+    assert mock_service.handle_action_approval.call_args.kwargs["user_id"] == "U999"
 
 
 @pytest.mark.asyncio
-async def test_handle_action_missing_fields():
+async def test_handle_action_missing_fields(handlers, mock_service):
     """Test handling action with missing fields."""
     mock_ack = AsyncMock()
     mock_client = AsyncMock()
-    mock_body = {
-        "user": {"id": "U123"},
-        "actions": [{"action_id": "approve_action"}],  # Missing value
-        "channel": {"id": "C123"},
-    }
-
-    with patch("src.slack.handlers.action.ActionService") as mock_service:
-        mock_service_instance = AsyncMock()
-        mock_service.return_value = mock_service_instance
-
-        from src.slack.handlers.action import handle_approve_action
+    mock_body = copy.deepcopy(dict(_APPROVE_ACTION_BODY))
+    del mock_body["message"]
 
-        # Should not raise exception
-        await handle_approve_action(mock_ack, mock_body, mock_client)
+    # Should not raise exception
+    await handlers["approve_action"](mock_ack, mock_body, mock_client)
 
-        mock_ack.assert_called_once()
+    mock_ack.assert_called_once()
+    assert mock_service.handle_action_approval.call_args.kwargs["action_id"] is None
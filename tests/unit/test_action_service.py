@@ -8,21 +8,20 @@ from src.config.channel_config import ChannelConfigManager
 from src.config.settings import Settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
     """Create mock settings."""
     settings = MagicMock(spec=Settings)
     return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_channel_manager():
     """Create mock channel manager."""
     return MagicMock(spec=ChannelConfigManager)
 
 
-@pytest.mark.asyncio
-async def test_action_service_initialization(mock_settings, mock_channel_manager):
+def test_action_service_initialization(mock_settings, mock_channel_manager):
     """Test action service initialization."""
     service = ActionService(mock_settings, mock_channel_manager)
 
@@ -35,7 +34,7 @@ async def test_handle_summary_approval(mock_settings, mock_channel_manager):
     """Test handling summary approval."""
     service = ActionService(mock_settings, mock_channel_manager)
 
-    mock_client = AsyncMock()
+    mock_client = MagicMock(chat_postMessage=AsyncMock())
 
     await service.handle_summary_approval(
         user_id="U123",
@@ -56,7 +55,7 @@ async def test_handle_action_approval(mock_settings, mock_channel_manager):
     """Test handling action approval."""
     service = ActionService(mock_settings, mock_channel_manager)
 
-    mock_client = AsyncMock()
+    mock_client = MagicMock(chat_postMessage=AsyncMock())
 
     await service.handle_action_approval(
         action_id=1,
@@ -77,7 +76,7 @@ async def test_handle_summary_approval_logs(mock_settings, mock_channel_manager)
     """Test that summary approval logs information."""
     service = ActionService(mock_settings, mock_channel_manager)
 
-    mock_client = AsyncMock()
+    mock_client = MagicMock(chat_postMessage=AsyncMock())
 
     with patch("src.slack.services.action_service.logger") as mock_logger:
         await service.handle_summary_approval(
@@ -95,7 +94,7 @@ async def test_handle_action_approval_logs(mock_settings, mock_channel_manager):
     """Test that action approval logs information."""
     service = ActionService(mock_settings, mock_channel_manager)
 
-    mock_client = AsyncMock()
+    mock_client = MagicMock(chat_postMessage=AsyncMock())
 
     with patch("src.slack.services.action_service.logger") as mock_logger:
         await service.handle_action_approval(
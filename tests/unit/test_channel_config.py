@@ -1,7 +1,11 @@
 """Tests for channel configuration."""
 
+import asyncio
+import shutil
+
 import pytest
 import yaml
+from pydantic import ValidationError
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -13,10 +17,10 @@ from src.config.channel_config import (
 )
 
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary config file."""
-    config_data = {
+@pytest.fixture(scope="module")
+def config_data():
+    """Create channel configuration data shared by the module's tests."""
+    return {
         "channels": [
             {
                 "channel_id": "C123",
@@ -46,22 +50,39 @@ def temp_config_file():
         ]
     }
 
-    with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+
+@pytest.fixture(scope="module")
+def temp_config_file(config_data, tmp_path_factory):
+    """Write the shared config data to a file for tests that need one.
+
+    Tests that rewrite the file must use ``config_file_copy`` instead.
+    """
+    path = tmp_path_factory.mktemp("config") / "channels.yaml"
+    with open(path, "w") as f:
         yaml.dump(config_data, f)
-        yield f.name
 
-    Path(f.name).unlink()
+    return str(path)
 
 
-def test_load_config(temp_config_file):
-    """Test loading configuration from file."""
-    manager = ChannelConfigManager(temp_config_file)
+@pytest.fixture
+def config_file_copy(temp_config_file, tmp_path):
+    """Copy the shared config file for a test that modifies it."""
+    return shutil.copy(temp_config_file, tmp_path / "channels.yaml")
 
-    channels = manager.list_channels()
+
+@pytest.fixture(scope="module")
+def channel_manager(config_data):
+    """Create a channel config manager shared by read-only tests."""
+    return ChannelConfigManager.from_dict(config_data)
+
+
+def test_load_config(channel_manager):
+    """Test loading configuration."""
+    channels = channel_manager.list_channels()
     assert len(channels) == 2
 
     # Check first channel
-    config = manager.get_channel_config("C123")
+    config = channel_manager.get_channel_config("C123")
     assert config is not None
     assert config.name == "test-channel"
     assert config.rag_index == "test-index"
@@ -69,11 +90,9 @@ def test_load_config(temp_config_file):
     assert config.enabled is True
 
 
-def test_get_channel_config(temp_config_file):
+def test_get_channel_config(channel_manager):
     """Test retrieving specific channel config."""
-    manager = ChannelConfigManager(temp_config_file)
-
-    config = manager.get_channel_config("C123")
+    config = channel_manager.get_channel_config("C123")
     assert config is not None
     assert config.channel_id == "C123"
     assert config.name == "test-channel"
@@ -92,28 +111,22 @@ def test_get_channel_config(temp_config_file):
     assert "restart_service" in config.policies.action_whitelist
 
 
-def test_get_channel_config_not_found(temp_config_file):
+def test_get_channel_config_not_found(channel_manager):
     """Test retrieving non-existent channel."""
-    manager = ChannelConfigManager(temp_config_file)
-
-    config = manager.get_channel_config("C999")
+    config = channel_manager.get_channel_config("C999")
     assert config is None
 
 
-def test_is_channel_enabled(temp_config_file):
+def test_is_channel_enabled(channel_manager):
     """Test checking if channel is enabled."""
-    manager = ChannelConfigManager(temp_config_file)
-
-    assert manager.is_channel_enabled("C123") is True
-    assert manager.is_channel_enabled("C456") is False
-    assert manager.is_channel_enabled("C999") is False
+    assert channel_manager.is_channel_enabled("C123") is True
+    assert channel_manager.is_channel_enabled("C456") is False
+    assert channel_manager.is_channel_enabled("C999") is False
 
 
-def test_list_channels(temp_config_file):
+def test_list_channels(channel_manager):
     """Test listing all channels."""
-    manager = ChannelConfigManager(temp_config_file)
-
-    channels = manager.list_channels()
+    channels = channel_manager.list_channels()
     assert len(channels) == 2
 
     channel_ids = [c.channel_id for c in channels]
@@ -121,9 +134,19 @@ def test_list_channels(temp_config_file):
     assert "C456" in channel_ids
 
 
-def test_reload_config(temp_config_file):
+def test_from_dict_skips_config_file(config_data, tmp_path):
+    """Test that a manager built from data doesn't read or create the file."""
+    config_path = tmp_path / "channels.yaml"
+    manager = ChannelConfigManager.from_dict(config_data, config_path)
+
+    assert len(manager.list_channels()) == 2
+    assert manager.config_path == config_path
+    assert not config_path.exists()
+
+
+def test_reload_config(config_file_copy):
     """Test reloading configuration."""
-    manager = ChannelConfigManager(temp_config_file)
+    manager = ChannelConfigManager(config_file_copy)
 
     # Initial load
     assert len(manager.list_channels()) == 2
@@ -140,7 +163,7 @@ def test_reload_config(temp_config_file):
         ]
     }
 
-    with open(temp_config_file, "w") as f:
+    with open(config_file_copy, "w") as f:
         yaml.dump(config_data, f)
 
     # Reload
@@ -204,3 +227,69 @@ def test_channel_config_model():
     assert config.first_response_minutes == 15
     assert isinstance(config.retrieval_params, RetrievalParams)
     assert isinstance(config.policies, ChannelPolicies)
+
+
+def test_channel_configs_are_immutable(channel_manager):
+    """Test that loaded configurations can't be mutated in place."""
+    config = channel_manager.get_channel_config("C123")
+
+    with pytest.raises(ValidationError):
+        config.enabled = False
+
+    with pytest.raises(TypeError):
+        channel_manager._channels["C999"] = config
+
+    assert channel_manager.list_channels() is channel_manager.list_channels()
+
+
+@pytest.mark.asyncio
+async def test_schedule_reload_debounces(temp_config_file, monkeypatch):
+    """Test that bursts of file events trigger a single reload."""
+    manager = ChannelConfigManager(temp_config_file)
+    manager._loop = asyncio.get_running_loop()
+    monkeypatch.setattr(manager, "RELOAD_DEBOUNCE_SECONDS", 0.01)
+
+    reloads = []
+    monkeypatch.setattr(manager, "reload", lambda: reloads.append(True))
+    monkeypatch.setattr(manager, "_stat_mtime", lambda: -1)
+
+    for _ in range(3):
+        manager._schedule_reload()
+
+    await asyncio.sleep(0.05)
+
+    assert len(reloads) == 1
+
+
+def test_reload_if_changed_skips_unmodified_file(temp_config_file, monkeypatch):
+    """Test that an unchanged mtime does not trigger a reparse."""
+    manager = ChannelConfigManager(temp_config_file)
+
+    reloads = []
+    monkeypatch.setattr(manager, "reload", lambda: reloads.append(True))
+
+    manager._reload_if_changed()
+
+    assert reloads == []
+
+
+def test_reload_if_changed_keeps_config_on_error(config_file_copy):
+    """Test that an invalid file keeps the previous configuration."""
+    manager = ChannelConfigManager(config_file_copy)
+    manager._mtime_ns = None
+
+    with open(config_file_copy, "w") as f:
+        f.write("channels: [{name: missing-fields}]")
+
+    manager._reload_if_changed()
+
+    assert len(manager.list_channels()) == 2
+
+
+def test_get_tier(channel_manager):
+    """Test metrics tier lookup for configured and unknown channels."""
+    assert channel_manager.get_tier("C123") == "other"
+    assert channel_manager.get_tier("C999") == "other"
+
+    config = ChannelConfig(channel_id="C1", name="eng", rag_index="kb", tier="eng")
+    assert config.tier == "eng"
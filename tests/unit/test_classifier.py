@@ -1,21 +1,24 @@
 """Tests for question classifier."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from src.classifier.question_classifier import QuestionClassifier
-from src.config.settings import Settings
+from src.config.settings import RuntimeSettings
 from src.models.conversation import QuestionType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
     """Create mock settings."""
-    settings = MagicMock(spec=Settings)
+    settings = MagicMock(spec=RuntimeSettings)
     settings.llm_provider = "openai"
     settings.llm_model = "gpt-4-turbo-preview"
     settings.openai_api_key = MagicMock()
     settings.openai_api_key.get_secret_value.return_value = "test-key"
+    settings.classifier_cache_enabled = False
     return settings
 
 
@@ -67,3 +70,88 @@ async def test_classifier_fallback_to_other(mock_settings):
     result = await classifier.classify("Some random text")
 
     assert result == QuestionType.OTHER
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw_output,expected",
+    [
+        ("Bug.", QuestionType.BUG),
+        ("how to", QuestionType.HOW_TO),
+        ("ops-action", QuestionType.OPS_ACTION),
+        ("**feature_request**", QuestionType.FEATURE_REQUEST),
+        ("something else", QuestionType.OTHER),
+    ],
+)
+async def test_classifier_normalizes_output(mock_settings, raw_output, expected):
+    """Test that model output variants map to the right type."""
+    mock_client = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = raw_output
+    mock_client.chat.completions.create.return_value = mock_response
+
+    classifier = QuestionClassifier(mock_settings)
+    classifier.client = mock_client
+
+    result = await classifier.classify("Some message")
+
+    assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_classifier_runs_concurrent_calls_concurrently(mock_settings):
+    """Test that concurrent classifications don't wait for each other."""
+    mock_client = AsyncMock()
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def respond(**kwargs):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        prompt = kwargs["messages"][-1]["content"]
+        response.choices[0].message.content = "bug" if "crash" in prompt else "how_to"
+        return response
+
+    mock_client.chat.completions.create.side_effect = respond
+
+    classifier = QuestionClassifier(mock_settings)
+    classifier.client = mock_client
+
+    results = await asyncio.gather(
+        classifier.classify("The app crashes"),
+        classifier.classify("How do I deploy?"),
+    )
+
+    assert results == [QuestionType.BUG, QuestionType.HOW_TO]
+    assert mock_client.chat.completions.create.call_count == 2
+    assert peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_classifier_anthropic_provider(mock_settings, monkeypatch):
+    """Test classification through the Anthropic client."""
+    # The settings mock is shared by the module, so undo these after the test
+    anthropic_api_key = MagicMock()
+    anthropic_api_key.get_secret_value.return_value = "test-key"
+    monkeypatch.setattr(mock_settings, "llm_provider", "anthropic")
+    monkeypatch.setattr(mock_settings, "anthropic_api_key", anthropic_api_key, raising=False)
+
+    mock_client = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.content = [MagicMock(text=" Feature_Request\n")]
+    mock_client.messages.create.return_value = mock_response
+
+    classifier = QuestionClassifier(mock_settings)
+    classifier.client = mock_client
+
+    result = await classifier.classify("Could you add dark mode?")
+
+    assert result == QuestionType.FEATURE_REQUEST
+    mock_client.messages.create.assert_called_once()
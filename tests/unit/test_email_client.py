@@ -1,16 +1,17 @@
 """Tests for email integration client."""
 
+import aiosmtplib
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
 from src.integrations.email_client import EmailClient
-from src.config.settings import Settings
+from src.config.settings import RuntimeSettings
 
 
 @pytest.fixture
 def mock_settings():
     """Create mock settings with email config."""
-    settings = MagicMock(spec=Settings)
+    settings = MagicMock(spec=RuntimeSettings)
     settings.smtp_host = "smtp.test.com"
     settings.smtp_port = 587
     settings.smtp_username = "test@example.com"
@@ -22,77 +23,119 @@ def mock_settings():
     return settings
 
 
+@pytest.fixture
+def mock_smtp():
+    """Patch the SMTP session used by the email client."""
+    with patch("src.integrations.email_client.aiosmtplib.SMTP") as mock_cls:
+        smtp = mock_cls.return_value
+        smtp.is_connected = False
+
+        async def connect():
+            smtp.is_connected = True
+
+        smtp.connect = AsyncMock(side_effect=connect)
+        smtp.login = AsyncMock()
+        smtp.send_message = AsyncMock()
+        smtp.noop = AsyncMock()
+        smtp.quit = AsyncMock()
+        smtp.smtp_cls = mock_cls
+        yield smtp
+
+
 @pytest.mark.asyncio
-async def test_send_escalation_success(mock_settings):
+async def test_send_escalation_success(mock_settings, mock_smtp):
     """Test successful escalation email."""
-    with patch("src.integrations.email_client.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
-        client = EmailClient(mock_settings)
+    client = EmailClient(mock_settings)
 
-        result = await client.send_escalation(
-            to_email="user@example.com",
-            subject="Escalation: Unresolved Issue",
-            summary="Test summary",
-            thread_url="https://slack.com/archives/C123/p123456",
-        )
+    result = await client.send_escalation(
+        to_email="user@example.com",
+        subject="Escalation: Unresolved Issue",
+        summary="Test summary",
+        thread_url="https://slack.com/archives/C123/p123456",
+    )
 
-        assert result is True
-        mock_send.assert_called_once()
+    assert result is True
+    mock_smtp.send_message.assert_called_once()
 
-        # Check email content
-        call_args = mock_send.call_args
-        message = call_args[0][0]
-        assert message["To"] == "user@example.com"
-        assert message["Subject"] == "Escalation: Unresolved Issue"
+    # Check email content
+    message = mock_smtp.send_message.call_args[0][0]
+    assert message["To"] == "user@example.com"
+    assert message["Subject"] == "Escalation: Unresolved Issue"
+
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_send_escalation_with_jira(mock_settings):
+async def test_send_escalation_with_jira(mock_settings, mock_smtp):
     """Test escalation email with Jira key."""
-    with patch("src.integrations.email_client.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
-        client = EmailClient(mock_settings)
+    client = EmailClient(mock_settings)
 
-        result = await client.send_escalation(
-            to_email="user@example.com",
-            subject="Escalation: Unresolved Issue",
-            summary="Test summary",
-            thread_url="https://slack.com/archives/C123/p123456",
-            jira_key="TEST-123",
-        )
+    result = await client.send_escalation(
+        to_email="user@example.com",
+        subject="Escalation: Unresolved Issue",
+        summary="Test summary",
+        thread_url="https://slack.com/archives/C123/p123456",
+        jira_key="TEST-123",
+    )
 
-        assert result is True
+    assert result is True
 
-        # Check that Jira link is in email
-        call_args = mock_send.call_args
-        message = call_args[0][0]
-        body = message.get_payload()[0].get_payload()
-        assert "TEST-123" in body
-        assert mock_settings.jira_url in body
+    # Check that Jira link is in email
+    message = mock_smtp.send_message.call_args[0][0]
+    body = message.get_payload(decode=True).decode()
+    assert "TEST-123" in body
+    assert mock_settings.jira_url in body
+
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_send_escalation_failure(mock_settings):
+async def test_send_escalation_failure(mock_settings, mock_smtp):
     """Test escalation email failure."""
-    with patch("src.integrations.email_client.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
-        mock_send.side_effect = Exception("SMTP connection failed")
+    mock_smtp.send_message.side_effect = Exception("SMTP connection failed")
 
-        client = EmailClient(mock_settings)
+    client = EmailClient(mock_settings)
 
-        result = await client.send_escalation(
-            to_email="user@example.com",
-            subject="Escalation: Unresolved Issue",
-            summary="Test summary",
-            thread_url="https://slack.com/archives/C123/p123456",
-        )
+    result = await client.send_escalation(
+        to_email="user@example.com",
+        subject="Escalation: Unresolved Issue",
+        summary="Test summary",
+        thread_url="https://slack.com/archives/C123/p123456",
+    )
+
+    assert result is False
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_escalation_smtp_auth(mock_settings, mock_smtp):
+    """Test SMTP connection and authentication parameters."""
+    client = EmailClient(mock_settings)
+
+    await client.send_escalation(
+        to_email="user@example.com",
+        subject="Test Subject",
+        summary="Test summary",
+        thread_url="https://slack.com/test",
+    )
 
-        assert result is False
+    # Check SMTP parameters
+    call_kwargs = mock_smtp.smtp_cls.call_args[1]
+    assert call_kwargs["hostname"] == "smtp.test.com"
+    assert call_kwargs["port"] == 587
+    assert call_kwargs["use_tls"] is True
+    mock_smtp.login.assert_called_once_with("test@example.com", "test-password")
+
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_send_escalation_smtp_auth(mock_settings):
-    """Test SMTP authentication parameters."""
-    with patch("src.integrations.email_client.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
-        client = EmailClient(mock_settings)
+async def test_send_escalation_reuses_connection(mock_settings, mock_smtp):
+    """Test that consecutive emails share one SMTP session."""
+    client = EmailClient(mock_settings)
 
+    for _ in range(3):
         await client.send_escalation(
             to_email="user@example.com",
             subject="Test Subject",
@@ -100,58 +143,138 @@ async def test_send_escalation_smtp_auth(mock_settings):
             thread_url="https://slack.com/test",
         )
 
-        # Check SMTP parameters
-        call_kwargs = mock_send.call_args[1]
-        assert call_kwargs["hostname"] == "smtp.test.com"
-        assert call_kwargs["port"] == 587
-        assert call_kwargs["username"] == "test@example.com"
-        assert call_kwargs["password"] == "test-password"
-        assert call_kwargs["use_tls"] is True
+    mock_smtp.connect.assert_called_once()
+    mock_smtp.login.assert_called_once()
+    assert mock_smtp.send_message.call_count == 3
+
+    await client.close()
+    mock_smtp.quit.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_send_escalation_from_email(mock_settings):
+async def test_send_escalation_reconnects(mock_settings, mock_smtp):
+    """Test reconnect when the server dropped the session."""
+    mock_smtp.send_message.side_effect = [
+        aiosmtplib.SMTPServerDisconnected("Connection lost"),
+        None,
+    ]
+
+    def close():
+        mock_smtp.is_connected = False
+
+    mock_smtp.close = MagicMock(side_effect=close)
+
+    client = EmailClient(mock_settings)
+
+    result = await client.send_escalation(
+        to_email="user@example.com",
+        subject="Test Subject",
+        summary="Test summary",
+        thread_url="https://slack.com/test",
+    )
+
+    assert result is True
+    assert mock_smtp.connect.call_count == 2
+    assert mock_smtp.send_message.call_count == 2
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_escalation_recovers_from_failed_login(mock_settings, mock_smtp):
+    """Test that a failed login is retried on the next send."""
+    mock_smtp.login.side_effect = [aiosmtplib.SMTPAuthenticationError(535, "Bad auth"), None]
+
+    def close():
+        mock_smtp.is_connected = False
+
+    mock_smtp.close = MagicMock(side_effect=close)
+
+    client = EmailClient(mock_settings)
+    kwargs = {
+        "to_email": "user@example.com",
+        "subject": "Test Subject",
+        "summary": "Test summary",
+        "thread_url": "https://slack.com/test",
+    }
+
+    assert await client.send_escalation(**kwargs) is False
+    mock_smtp.close.assert_called_once()
+    mock_smtp.send_message.assert_not_called()
+
+    assert await client.send_escalation(**kwargs) is True
+    assert mock_smtp.connect.call_count == 2
+    assert mock_smtp.login.call_count == 2
+    mock_smtp.send_message.assert_called_once()
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_escalation_from_email(mock_settings, mock_smtp):
     """Test from email address."""
-    with patch("src.integrations.email_client.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
-        client = EmailClient(mock_settings)
+    client = EmailClient(mock_settings)
 
-        await client.send_escalation(
-            to_email="user@example.com",
-            subject="Test Subject",
-            summary="Test summary",
-            thread_url="https://slack.com/test",
-        )
+    await client.send_escalation(
+        to_email="user@example.com",
+        subject="Test Subject",
+        summary="Test summary",
+        thread_url="https://slack.com/test",
+    )
+
+    message = mock_smtp.send_message.call_args[0][0]
+    assert message["From"] == "bot@example.com"
 
-        call_args = mock_send.call_args
-        message = call_args[0][0]
-        assert message["From"] == "bot@example.com"
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_send_escalation_content_format(mock_settings):
+async def test_send_escalation_content_format(mock_settings, mock_smtp):
     """Test email content formatting."""
-    with patch("src.integrations.email_client.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
-        client = EmailClient(mock_settings)
+    client = EmailClient(mock_settings)
 
-        summary = "User reported a critical bug in the payment system"
-        thread_url = "https://slack.com/archives/C123/p123456"
+    summary = "User reported a critical bug in the payment system"
+    thread_url = "https://slack.com/archives/C123/p123456"
 
-        await client.send_escalation(
-            to_email="user@example.com",
-            subject="Critical Escalation",
-            summary=summary,
-            thread_url=thread_url,
-            jira_key="BUG-456",
-        )
+    await client.send_escalation(
+        to_email="user@example.com",
+        subject="Critical Escalation",
+        summary=summary,
+        thread_url=thread_url,
+        jira_key="BUG-456",
+    )
+
+    message = mock_smtp.send_message.call_args[0][0]
+    body = message.get_payload(decode=True).decode()
+
+    # Check content includes key elements
+    assert "Slack RAG Assistant" in body
+    assert "Escalation Notice" in body
+    assert summary in body
+    assert thread_url in body
+    assert "BUG-456" in body
+    assert "automated message" in body.lower()
 
-        call_args = mock_send.call_args
-        message = call_args[0][0]
-        body = message.get_payload()[0].get_payload()
-
-        # Check content includes key elements
-        assert "Slack RAG Assistant" in body
-        assert "Escalation Notice" in body
-        assert summary in body
-        assert thread_url in body
-        assert "BUG-456" in body
-        assert "automated message" in body.lower()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_escalation_single_part(mock_settings, mock_smtp):
+    """Test that the email is sent as a single plain-text part."""
+    client = EmailClient(mock_settings)
+
+    await client.send_escalation(
+        to_email="user@example.com",
+        subject="Test Subject",
+        summary="Costs $5 per ${seat}",
+        thread_url="https://slack.com/test",
+    )
+
+    message = mock_smtp.send_message.call_args[0][0]
+    body = message.get_payload(decode=True).decode()
+    assert not message.is_multipart()
+    assert message.get_content_type() == "text/plain"
+    assert "Costs $5 per ${seat}" in body
+    assert "Jira Issue" not in body
+
+    await client.close()
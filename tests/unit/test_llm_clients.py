@@ -0,0 +1,15 @@
+"""Tests for shared LLM clients."""
+
+from src.integrations.llm_clients import get_anthropic_client, get_openai_client
+
+
+def test_openai_client_is_shared():
+    """Test that one OpenAI client is reused per API key."""
+    assert get_openai_client("key-a") is get_openai_client("key-a")
+    assert get_openai_client("key-a") is not get_openai_client("key-b")
+
+
+def test_anthropic_client_is_shared():
+    """Test that one Anthropic client is reused per API key."""
+    assert get_anthropic_client("key-a") is get_anthropic_client("key-a")
+    assert get_anthropic_client("key-a") is not get_anthropic_client("key-b")
@@ -0,0 +1,90 @@
+"""Tests for background message processing."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from src.slack.services import message_queue
+from src.slack.services.message_queue import (
+    enqueue_message,
+    start_message_workers,
+    stop_message_workers,
+)
+
+
+@pytest.mark.asyncio
+async def test_workers_run_queued_jobs():
+    """Test that queued jobs run and a failing job doesn't stop the worker."""
+    done = []
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def job():
+        done.append(True)
+
+    start_message_workers(worker_count=1, max_queue_size=10)
+    await enqueue_message("C1", failing)
+    await enqueue_message("C2", job)
+    await stop_message_workers(timeout=1.0)
+
+    assert done == [True]
+
+
+@pytest.mark.asyncio
+async def test_jobs_paced_per_channel():
+    """Test that jobs for one channel are spaced out but other channels aren't."""
+    loop = asyncio.get_running_loop()
+    started = {}
+
+    def job(name):
+        async def run():
+            started[name] = loop.time()
+
+        return run
+
+    with patch.object(message_queue, "CHANNEL_POST_INTERVAL_SECONDS", 0.2):
+        start_message_workers(worker_count=3, max_queue_size=10)
+        await enqueue_message("C1", job("first"))
+        await enqueue_message("C1", job("second"))
+        await enqueue_message("C2", job("other"))
+        await stop_message_workers(timeout=1.0)
+
+    assert started["second"] - started["first"] >= 0.19
+    assert started["other"] - started["first"] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_paced_channel_does_not_hold_workers():
+    """Test that a burst in one channel doesn't delay another channel."""
+    loop = asyncio.get_running_loop()
+    started = {}
+
+    def job(name):
+        async def run():
+            started[name] = loop.time()
+
+        return run
+
+    with patch.object(message_queue, "CHANNEL_POST_INTERVAL_SECONDS", 0.2):
+        start_message_workers(worker_count=1, max_queue_size=10)
+        for i in range(3):
+            await enqueue_message("BUSY", job(f"busy{i}"))
+        await enqueue_message("QUIET", job("quiet"))
+        await stop_message_workers(timeout=1.0)
+
+    assert started["quiet"] - started["busy0"] < 0.1
+    assert started["busy0"] < started["busy1"] < started["busy2"]
+    assert started["busy2"] - started["busy1"] >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_enqueue_requires_workers():
+    """Test that enqueueing before the workers start fails loudly."""
+
+    async def job():
+        pass
+
+    with pytest.raises(RuntimeError):
+        await enqueue_message("C1", job)
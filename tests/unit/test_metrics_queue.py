@@ -0,0 +1,111 @@
+"""Tests for queued Prometheus metric updates."""
+
+import asyncio
+
+import pytest
+
+from src.observability.metrics import REGISTRY
+from src.observability.metrics_queue import (
+    _apply,
+    metric_queue,
+    record_metric,
+    start_metrics_drain,
+    stop_metrics_drain,
+)
+
+
+def _sample(name, **labels):
+    """Read a sample value from the bot metrics registry."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_drain_applies_queued_updates():
+    """Test that the drain task applies counter and histogram updates."""
+    labels = {"channel_tier": "drain-test", "status": "success"}
+    before = _sample("slack_rag_messages_processed_total", **labels)
+
+    start_metrics_drain()
+    record_metric("messages_processed_total", labels)
+    record_metric("messages_processed_total", labels)
+    record_metric("first_response_time_seconds", {"channel_tier": "drain-test"}, 2.5)
+
+    await asyncio.sleep(0.2)
+    await stop_metrics_drain()
+
+    assert _sample("slack_rag_messages_processed_total", **labels) == before + 2
+    assert _sample(
+        "slack_rag_first_response_time_seconds_sum", channel_tier="drain-test"
+    ) == pytest.approx(2.5)
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_updates():
+    """Test that stopping applies updates still in the queue."""
+    labels = {"channel_tier": "flush-test", "rating": "helpful"}
+    before = _sample("slack_rag_feedback_total", **labels)
+
+    record_metric("feedback_total", labels)
+    await stop_metrics_drain()
+
+    assert metric_queue.empty()
+    assert _sample("slack_rag_feedback_total", **labels) == before + 1
+
+
+def test_labeled_child_is_cached():
+    """Test that labeled children are resolved once per label set."""
+    from src.observability.metrics import labeled
+
+    labels = {"channel_tier": "cache-test", "rating": "positive"}
+
+    assert labeled("feedback_total", labels) is labeled("feedback_total", dict(labels))
+
+
+def test_apply_observes_summary():
+    """Test that summary updates are observed rather than incremented."""
+    before = _sample("slack_rag_documents_retrieved_count", index="apply-test")
+
+    _apply("rag_documents_retrieved", {"index": "apply-test"}, 4)
+
+    assert _sample("slack_rag_documents_retrieved_count", index="apply-test") == before + 1
+    assert _sample("slack_rag_documents_retrieved_sum", index="apply-test") == pytest.approx(4)
+
+
+def test_apply_unlabeled_gauge():
+    """Test that metrics without labels are updated directly."""
+    before = _sample("slack_rag_active_conversations")
+
+    _apply("active_conversations", {}, None)
+
+    assert _sample("slack_rag_active_conversations") == before + 1
+
+
+def test_record_metric_counts_drops_when_full(monkeypatch):
+    """Test that updates beyond the queue bound are dropped and counted."""
+    from src.observability import metrics_queue
+
+    monkeypatch.setattr(metrics_queue, "metric_queue", asyncio.Queue(maxsize=1))
+    labels = {"component": "metrics_queue", "error_type": "queue_full"}
+    before = _sample("slack_rag_errors_total", **labels)
+
+    record_metric("feedback_total", {"channel_tier": "full-test", "rating": "helpful"})
+    record_metric("feedback_total", {"channel_tier": "full-test", "rating": "helpful"})
+
+    assert metrics_queue.metric_queue.qsize() == 1
+    assert _sample("slack_rag_errors_total", **labels) == before + 1
+
+
+def test_record_error_folds_unknown_types():
+    """Test that unknown error types are counted as "other"."""
+    from src.observability.metrics import record_error
+
+    before = _sample("slack_rag_errors_total", component="test", error_type="other")
+
+    record_error("test", "KeyError('user-123')")
+    record_error("test", "other")
+
+    assert _sample("slack_rag_errors_total", component="test", error_type="other") == before + 2
+    assert (
+        _sample("slack_rag_errors_total", component="test", error_type="KeyError('user-123')")
+        == 0.0
+    )
@@ -0,0 +1,135 @@
+"""Tests for the semantic classifier cache."""
+
+import asyncio
+
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock, MagicMock
+
+from src.classifier.question_classifier import QuestionClassifier
+from src.classifier.semantic_cache import SemanticClassifierCache
+from src.config.settings import RuntimeSettings
+from src.models.conversation import QuestionType
+
+
+def _unit(*values):
+    """Build a normalized float32 vector."""
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _embedding_response(vectors):
+    """Build a mock OpenAI embeddings response."""
+    response = MagicMock()
+    response.data = [MagicMock(embedding=list(v)) for v in vectors]
+    return response
+
+
+@pytest.fixture
+def cache():
+    """Create a cache with a mock embeddings client."""
+    return SemanticClassifierCache(
+        client=AsyncMock(),
+        model="text-embedding-3-small",
+        threshold=0.9,
+        max_entries=2,
+        ttl_seconds=3600,
+    )
+
+
+def test_lookup_empty_cache(cache):
+    """Test lookup on an empty cache."""
+    assert cache.lookup(_unit(1, 0)) is None
+
+
+def test_lookup_similar_hit(cache):
+    """Test that a near-duplicate embedding hits."""
+    cache.insert(_unit(1, 0), QuestionType.BUG)
+
+    assert cache.lookup(_unit(1, 0.1)) == QuestionType.BUG
+
+
+def test_lookup_dissimilar_miss(cache):
+    """Test that an unrelated embedding misses."""
+    cache.insert(_unit(1, 0), QuestionType.BUG)
+
+    assert cache.lookup(_unit(0, 1)) is None
+
+
+def test_lookup_expired_entry(cache):
+    """Test that expired entries are ignored."""
+    cache.ttl_seconds = 0
+    cache.insert(_unit(1, 0), QuestionType.BUG)
+
+    assert cache.lookup(_unit(1, 0)) is None
+
+
+def test_insert_evicts_least_recently_used(cache):
+    """Test LRU eviction when the cache is full."""
+    cache.insert(_unit(1, 0), QuestionType.BUG)
+    cache.insert(_unit(0, 1), QuestionType.HOW_TO)
+
+    # Touch the first entry so the second becomes least recently used
+    assert cache.lookup(_unit(1, 0)) == QuestionType.BUG
+
+    cache.insert(_unit(-1, 0), QuestionType.OPS_ACTION)
+
+    assert len(cache) == 2
+    assert cache.lookup(_unit(1, 0)) == QuestionType.BUG
+    assert cache.lookup(_unit(0, 1)) is None
+    assert cache.lookup(_unit(-1, 0)) == QuestionType.OPS_ACTION
+
+
+@pytest.mark.asyncio
+async def test_embed_batches_concurrent_calls(cache):
+    """Test that concurrent embed calls share one request."""
+    cache.client.embeddings.create.return_value = _embedding_response([[3, 4], [0, 2]])
+
+    first, second = await asyncio.gather(cache.embed("a"), cache.embed("b"))
+
+    cache.client.embeddings.create.assert_called_once()
+    assert cache.client.embeddings.create.call_args[1]["input"] == ["a", "b"]
+    np.testing.assert_allclose(first, [0.6, 0.8], rtol=1e-6)
+    np.testing.assert_allclose(second, [0.0, 1.0], rtol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_embed_propagates_errors(cache):
+    """Test that embedding failures reach the caller."""
+    cache.client.embeddings.create.side_effect = Exception("API Error")
+
+    with pytest.raises(Exception, match="API Error"):
+        await cache.embed("a")
+
+
+@pytest.mark.asyncio
+async def test_classifier_uses_cache():
+    """Test that a cached label skips the LLM call."""
+    settings = MagicMock(spec=RuntimeSettings)
+    settings.llm_provider = "openai"
+    settings.llm_model = "gpt-4-turbo-preview"
+    settings.openai_api_key = MagicMock()
+    settings.openai_api_key.get_secret_value.return_value = "test-key"
+    settings.classifier_cache_enabled = True
+    settings.embeddings_provider = "openai"
+    settings.embeddings_model = "text-embedding-3-small"
+    settings.classifier_cache_threshold = 0.9
+    settings.classifier_cache_max_entries = 10
+    settings.classifier_cache_ttl_seconds = 3600
+
+    classifier = QuestionClassifier(settings)
+
+    mock_client = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "bug"
+    mock_client.chat.completions.create.return_value = mock_response
+    mock_client.embeddings.create.return_value = _embedding_response([[1, 0]])
+    classifier.client = mock_client
+    classifier.cache.client = mock_client
+
+    first = await classifier.classify("The app crashes")
+    second = await classifier.classify("The app crashes")
+
+    assert first == second == QuestionType.BUG
+    mock_client.chat.completions.create.assert_called_once()
@@ -1,10 +1,12 @@
 """Tests for application settings."""
 
+import dataclasses
+
 import pytest
 from unittest.mock import MagicMock, patch
 from pydantic import ValidationError
 
-from src.config.settings import Settings, get_settings
+from src.config.settings import RuntimeSettings, Settings, get_settings
 
 
 def test_settings_defaults():
@@ -162,3 +164,25 @@ def test_default_sla_values():
         assert settings.default_first_response_minutes == 15
         assert settings.enable_pii_redaction is True
         assert settings.enable_action_approval is True
+
+
+def test_runtime_settings_snapshot():
+    """Test runtime settings snapshot of hot-path fields."""
+    with patch.dict("os.environ", {
+        "SLACK_BOT_TOKEN": "xoxb-test",
+        "SLACK_APP_TOKEN": "xapp-test",
+        "SLACK_SIGNING_SECRET": "secret",
+        "LLM_MODEL": "gpt-4o",
+        "SMTP_PASSWORD": "smtp-secret",
+    }, clear=True):
+        settings = Settings()
+
+    runtime = RuntimeSettings.from_settings(settings)
+
+    assert runtime.llm_model == "gpt-4o"
+    assert runtime.smtp_password.get_secret_value() == "smtp-secret"
+    assert "smtp-secret" not in repr(runtime)
+    assert not hasattr(runtime, "__dict__")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        runtime.llm_model = "other"
@@ -1,10 +1,13 @@
 """Tests for web dashboard application."""
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
+from src.models.conversation import ConversationStatus, QuestionType
 from src.web.app import app, manager
 
 
@@ -47,17 +50,17 @@ def test_logs_page(client):
 @pytest.mark.asyncio
 async def test_stats_endpoint():
     """Test stats endpoint with mocked database."""
-    with patch("src.web.app.AsyncSessionLocal") as mock_session_class:
+    with patch("src.web.app.ReadSessionLocal") as mock_session_class:
         # Create mock session
         mock_session = AsyncMock()
         mock_session.__aenter__.return_value = mock_session
         mock_session.__aexit__.return_value = None
         mock_session_class.return_value = mock_session
 
-        # Mock database queries
-        mock_result = AsyncMock()
-        mock_result.scalar_one.return_value = 100
-        mock_result.all.return_value = [("bug", 50), ("how_to", 30)]
+        # Mock database queries; execute is awaited, result accessors are sync
+        mock_result = MagicMock()
+        mock_result.one.return_value = (100, 10, 20, 15)
+        mock_result.all.return_value = [(QuestionType.BUG, 50), (None, 30)]
         mock_session.execute.return_value = mock_result
 
         # Import and call function
@@ -65,15 +68,17 @@ async def test_stats_endpoint():
 
         stats = await get_stats()
 
-        assert "total_conversations" in stats
-        assert "helpful_rate" in stats
+        assert stats["total_conversations"] == 100
+        assert stats["active_conversations"] == 10
+        assert stats["helpful_rate"] == 75.0
+        assert stats["type_distribution"] == {"bug": 50, "unknown": 30}
         assert "timestamp" in stats
 
 
 @pytest.mark.asyncio
 async def test_recent_conversations():
     """Test recent conversations endpoint."""
-    with patch("src.web.app.AsyncSessionLocal") as mock_session_class:
+    with patch("src.web.app.ReadSessionLocal") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.__aenter__.return_value = mock_session
         mock_session.__aexit__.return_value = None
@@ -86,13 +91,12 @@ async def test_recent_conversations():
         mock_conversation.thread_ts = "1234567890.123456"
         mock_conversation.user_id = "U123"
         mock_conversation.question_type = None
-        mock_conversation.status = "active"
+        mock_conversation.status = ConversationStatus.ACTIVE
         mock_conversation.created_at = datetime.utcnow()
         mock_conversation.jira_key = None
 
-        mock_result = AsyncMock()
-        mock_result.scalars.return_value.all.return_value = [mock_conversation]
-        mock_session.execute.return_value = mock_result
+        # Column rows are iterated straight off the result
+        mock_session.execute.return_value = [mock_conversation]
 
         from src.web.app import get_recent_conversations
 
@@ -106,7 +110,7 @@ async def test_recent_conversations():
 @pytest.mark.asyncio
 async def test_audit_events():
     """Test audit events endpoint."""
-    with patch("src.web.app.AsyncSessionLocal") as mock_session_class:
+    with patch("src.web.app.ReadSessionLocal") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.__aenter__.return_value = mock_session
         mock_session.__aexit__.return_value = None
@@ -122,9 +126,7 @@ async def test_audit_events():
         mock_event.result = "success"
         mock_event.created_at = datetime.utcnow()
 
-        mock_result = AsyncMock()
-        mock_result.scalars.return_value.all.return_value = [mock_event]
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = [mock_event]
 
         from src.web.app import get_audit_events
 
@@ -138,14 +140,14 @@ async def test_audit_events():
 @pytest.mark.asyncio
 async def test_channel_stats():
     """Test channel statistics endpoint."""
-    with patch("src.web.app.AsyncSessionLocal") as mock_session_class:
+    with patch("src.web.app.ReadSessionLocal") as mock_session_class:
         mock_session = AsyncMock()
         mock_session.__aenter__.return_value = mock_session
         mock_session.__aexit__.return_value = None
         mock_session_class.return_value = mock_session
 
         # Mock channel stats
-        mock_result = AsyncMock()
+        mock_result = MagicMock()
         mock_result.all.return_value = [("C123", 100, 10)]
         mock_session.execute.return_value = mock_result
 
@@ -213,8 +215,67 @@ async def test_broadcast():
     # Broadcast
     await manager.broadcast({"type": "test", "data": "hello"})
 
-    # Verify message was sent
-    mock_websocket.send_json.assert_called_once()
+    # Verify message was sent once, pre-serialized
+    mock_websocket.send_text.assert_called_once_with('{"type":"test","data":"hello"}')
 
     # Clean up
     manager.disconnect(mock_websocket)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_clients():
+    """Test that clients failing a broadcast are disconnected."""
+    healthy = AsyncMock()
+    broken = AsyncMock()
+    broken.send_text.side_effect = RuntimeError("connection closed")
+    manager.active_connections.extend([healthy, broken])
+
+    await manager.broadcast({"type": "test"})
+
+    healthy.send_text.assert_called_once()
+    assert broken not in manager.active_connections
+    broken.close.assert_awaited_once()
+    healthy.close.assert_not_called()
+
+    # The dropped client's own disconnect is a no-op
+    manager.disconnect(broken)
+
+    # Clean up
+    manager.disconnect(healthy)
+
+
+@pytest.mark.asyncio
+async def test_result_cache_single_flight():
+    """Test that concurrent callers share one computation until the TTL expires."""
+    from src.web.app import ResultCache
+
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"calls": calls}
+
+    cache = ResultCache(ttl_seconds=60)
+    results = await asyncio.gather(*(cache.get(compute) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == {"calls": 1} for result in results)
+
+    cache.clear()
+    assert await cache.get(compute) == {"calls": 2}
+
+
+@pytest.mark.asyncio
+async def test_metrics_summary_snapshot():
+    """Test that the metrics summary covers bot metrics and is shared briefly."""
+    from src.web.app import _metrics_summary_cache, get_metrics_summary
+
+    _metrics_summary_cache.clear()
+    first = await get_metrics_summary()
+    second = await get_metrics_summary()
+
+    assert first is second
+    assert first["metrics"]
+    assert all(name.startswith("slack_rag_") for name in first["metrics"])